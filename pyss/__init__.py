@@ -1,4 +1,4 @@
-from .statistic import Statistic, PairwiseStatistic, ReducedStatistic
+from .statistic import Statistic, PairwiseStatistic, CorrelationStatistic, ReducedStatistic, numba_pairwise
 from .reducer import Reducer
 from .config import Config
 from .calculator import Calculator
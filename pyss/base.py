@@ -7,22 +7,38 @@ import os
 import yaml
 import inspect
 
-from scipy.stats import zscore
 from typing import Iterable, Union, Generator, Any, TYPE_CHECKING
 from abc import ABC, abstractmethod
-from textwrap import dedent
+from functools import lru_cache
+from itertools import islice
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Prefer orjson for parsing JSON configurations when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 if TYPE_CHECKING:
     from pyss.config import Config
 
 # GLOBAL SETTINGS
 IGNORE_IMPORT_WARNINGS = False
+NAN_SCAN_CHUNK_SIZE = 1 << 20
 
 # URLs
 PYSS_GITHUB_ISSUES_URL = "https://github.com/garry-cotton/pyss/issues/"
 CUSTOM_COMPONENTS_URL = "https://github.com/garry-cotton/pyss/blob/main/README.md"
 STATISTIC_FILTERING_URL = ""
 
+# Parsed __init__ argument specifications per Component class
+_ARG_CACHE: dict[type, tuple[list[str], dict[str, Any]]] = dict()
+
 class Component(ABC):
 
     """
@@ -31,44 +47,38 @@ class Component(ABC):
     Provides functionality for constructing configuration files.
     """
 
+    __STR_TEMPLATE = ("\n{component_type_name}: {full_name}"
+                      "\nName: {name}"
+                      "\nActive Parameters: {params}"
+                      "\nAssociated Configuration: {cfg_name}\n")
+
+    __INFO_TEMPLATE = ("\n{component_type_name}: {full_name}"
+                       "\nName: {name}"
+                       "\nRequired Parameters: {required_args}"
+                       "\nOptional Parameters: {optional_args}\n")
+
     def __init__(self):
 
         name = self.__get_property_val(self.name)
-        check_type(name, str)
+        check_type(name, str, arg_name="name")
 
         labels = self.__get_property_val(self.labels)
-        check_iterable(labels, str)
+        check_iterable(labels, str, arg_name="labels")
 
         self.__cfg: Union[Config, None] = None
         self.__scheme: Union[str, None] = None
 
     def __new__(cls, *args, **kwargs):
 
-        # Get class arguments
-        arg_dict = dict()
-        arg_list = list(args)
-        arg_spec = inspect.getfullargspec(cls.__init__)
-        arg_names = [arg for arg in arg_spec.args if arg != "self"]
-        arg_defaults = list(arg_spec.defaults) if arg_spec.defaults else list()
-        n_args = len(arg_names)
-
-        # Set defaults in dict
-        for i in range(n_args, 0, -1):
-            arg_name = arg_names[i - 1]
-            default = arg_defaults.pop() if arg_defaults else None
-            arg_dict[arg_name] = default
-
-        if arg_spec.kwonlydefaults:
-            arg_dict.update(arg_spec.kwonlydefaults)
+        # Get class arguments from the cached specification
+        arg_names, arg_defaults = get_init_arg_spec(cls)
+        arg_dict = dict(arg_defaults)
 
         # Get arg values
-        for i, arg in enumerate(arg_list):
-            arg_name = arg_names[i]
-            arg_dict[arg_name] = arg
+        arg_dict.update(zip(arg_names, args))
 
         # Get kwarg values
-        for kwarg_name, kwarg in kwargs.items():
-            arg_dict[kwarg_name] = kwarg
+        arg_dict.update(kwargs)
 
         instance = super().__new__(cls)
         instance.__params = arg_dict
@@ -133,36 +143,35 @@ class Component(ABC):
         cfg_name = self.cfg.name if self.cfg is not None else "None"
         component_type_name = self._get_component_type().__name__
 
-        return dedent(
-            f"""
-            {component_type_name}: {full_name}
-            Name: {self.name}
-            Active Parameters: {self.params}
-            Associated Configuration: {cfg_name}
-            """)
+        return self.__STR_TEMPLATE.format(component_type_name=component_type_name,
+                                          full_name=full_name,
+                                          name=self.name,
+                                          params=self.params,
+                                          cfg_name=cfg_name)
 
     @classmethod
     def __info__(cls):
-        self_type = type(cls)
-        full_name = get_fully_qualified_type_name(self_type)
+        full_name = get_fully_qualified_type_name(cls)
         component_type_name = cls._get_component_type().__name__
-        args = get_obj_init_args(self_type)
+        args = get_obj_init_args(cls)
         required_args = list()
         optional_args = dict()
 
+        # Required arguments have no default, as for get_required_init_args. Falsy defaults are still optional.
         for arg, default in args.items():
-            if default:
-                optional_args[arg] = default
-            else:
+            if default is None:
                 required_args.append(arg)
+            else:
+                optional_args[arg] = default
+
+        # Names implemented as properties are only available from instances, so fall back to the class name.
+        name = cls.name if isinstance(cls.name, str) else cls.__name__
 
-        return dedent(
-            f"""
-            {component_type_name}: {full_name}
-            Name: {cls.name}
-            Required Parameters: {required_args}
-            Optional Parameters: {optional_args}
-            """)
+        return cls.__INFO_TEMPLATE.format(component_type_name=component_type_name,
+                                          full_name=full_name,
+                                          name=name,
+                                          required_args=required_args,
+                                          optional_args=optional_args)
 
 
 def info(component: Component):
@@ -170,77 +179,93 @@ def info(component: Component):
         print(component.__info__())
 
 
-def get_fully_qualified_type_name(type_obj: type):
+def get_init_arg_spec(class_obj: type) -> tuple[list[str], dict[str, Any]]:
+
+    # Return the cached specification if the class has been seen before
+    arg_spec_tuple = _ARG_CACHE.get(class_obj)
+
+    if arg_spec_tuple is not None:
+        return arg_spec_tuple
+
+    # Get class init argument specification
+    arg_spec = inspect.getfullargspec(class_obj.__init__)
+    arg_names = [arg for arg in arg_spec.args if arg != "self"]
+    defaults = list(arg_spec.defaults) if arg_spec.defaults else list()
+
+    # Pair defaults from the last argument backwards, with None for required arguments
+    arg_defaults = dict()
+
+    for arg_name in reversed(arg_names):
+        arg_defaults[arg_name] = defaults.pop() if defaults else None
+
+    # Keyword-only arguments follow, with None for those without defaults
+    kwonly_defaults = arg_spec.kwonlydefaults or dict()
+
+    for arg_name in arg_spec.kwonlyargs:
+        arg_defaults[arg_name] = kwonly_defaults.get(arg_name)
+
+    arg_spec_tuple = (arg_names, arg_defaults)
+    _ARG_CACHE[class_obj] = arg_spec_tuple
+    return arg_spec_tuple
 
-    try:
-        module_name = type_obj.__module__ + "."
-    finally:
-        pass
+
+@lru_cache(maxsize=None)
+def get_fully_qualified_type_name(type_obj: type):
+    module_name = getattr(type_obj, "__module__", None)
 
     if not module_name:
         return type_obj.__name__
 
-    return module_name + type_obj.__name__
+    return f"{module_name}.{type_obj.__name__}"
 
 
+@lru_cache(maxsize=None)
 def has_required_func_args(func: function) -> bool:
     pars = inspect.signature(func).parameters
+    return any(par.default is inspect._empty for arg_name, par in pars.items() if arg_name != "self")
 
-    for arg_name, par in pars.items():
-        if arg_name == "self":
-            continue
 
-        if par.default is inspect._empty:
-            return True
-        
-    return False
+def get_obj_init_args(class_obj: type) -> dict[str, Any]:
 
+    # Reuse the cached class init argument specification
+    arg_names, arg_defaults = get_init_arg_spec(class_obj)
 
-def get_obj_init_args(class_obj: type) -> dict[str, Any]:
+    # Positional arguments in declaration order, followed by keyword-only arguments
+    args = {arg_name: arg_defaults[arg_name] for arg_name in arg_names}
+    args.update(arg_defaults)
+    return args
 
-    # Get class init argument specification
-    arg_spec = inspect.getfullargspec(class_obj.__init__)
-    args = dict()
 
-    # Add standard args
-    n_defaults = len(arg_spec.defaults) if arg_spec.defaults else 0
+@lru_cache(maxsize=None)
+def get_required_init_args(class_obj: type) -> frozenset[str]:
 
-    optional_args = arg_spec.args[-n_defaults:] if n_defaults > 0 else list()
-    required_args = arg_spec.args[:-n_defaults] if n_defaults > 0 else arg_spec.args
+    # Arguments without a default
+    return frozenset(arg for arg, default in get_obj_init_args(class_obj).items() if default is None)
 
-    for arg in required_args:
-        args[arg] = None
-    
-    for i, arg in enumerate(optional_args):
-        args[arg] = arg_spec.defaults[i]
 
-    # Add keyword arguments
-    has_defaults = arg_spec.kwonlydefaults is not None
+@lru_cache(maxsize=None)
+def has_init_var_kwargs(class_obj: type) -> bool:
 
-    for i, arg in enumerate(arg_spec.kwonlyargs):
-        args[arg] = arg_spec.kwonlydefaults.get(arg) if has_defaults else None
+    # Whether the constructor accepts arbitrary keyword arguments
+    return inspect.getfullargspec(class_obj.__init__).varkw is not None
 
-    args.pop("self", None)
-    return args
 
+def to_python_value(value: Any) -> Any:
 
-def retrieve_arg_name(var, max_steps: int = 2):
-    frame = inspect.currentframe()
-    steps = 0
-    var_name = None
+    # Numpy values and tuples have no safe YAML representation, so export them as plain Python scalars and lists
+    if isinstance(value, np.generic):
+        return value.item()
 
-    while steps < max_steps:
-        frame = frame.f_back
-        local_vars = frame.f_locals.items()
-        var_names = [var_name for var_name, var_val in local_vars if var_val is var]
-        steps += 1
+    if isinstance(value, np.ndarray):
+        return value.tolist()
 
-        if var_names:
-            var_name = var_names[0]
-        else:
-            break
+    if isinstance(value, (list, tuple)):
+        return [to_python_value(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: to_python_value(item) for key, item in value.items()}
 
-    return var_name
+    return value
 
 
 def get_type_name(arg_val):
@@ -249,59 +274,49 @@ def get_type_name(arg_val):
 
 def check_type(arg_val: object,
                arg_types: Union[type, Iterable[type]],
-               arg_name: str = None,
+               arg_name: str = "Argument",
                is_try: bool = False,
                custom_error_msg: str = None) -> Union[None, bool]:
 
-    if not arg_name:
-        arg_name = retrieve_arg_name(arg_val)
+    # isinstance accepts a tuple of types natively and stops on the first match
+    if not isinstance(arg_types, tuple):
+        arg_types = (arg_types,) if isinstance(arg_types, type) else tuple(arg_types)
 
-    if not isinstance(arg_types, Iterable):
-        arg_types = [arg_types]
-    
-    type_names = list()
+    if isinstance(arg_val, arg_types):
+        return True
 
-    for arg_type in arg_types:    
-        type_name = arg_type.__name__
-        type_names.append(type_name)
-    
-        if isinstance(arg_val, arg_type):
-            return True
-            
     if is_try:
         return False
 
-    actual_type = get_type_name(arg_val)
-
     if custom_error_msg is not None:
         raise TypeError(custom_error_msg)
 
+    type_names = [arg_type.__name__ for arg_type in arg_types]
+    actual_type = get_type_name(arg_val)
     raise TypeError(f"{arg_name} should be one of {type_names} types, received {actual_type}.")
 
-    if is_try:
-        return True
-
 
 def check_iterable(iterable: Iterable,
                    iterable_type: Union[type, None] = None,
-                   arg_name: str = None,
+                   arg_name: str = "Argument",
                    is_try: bool = False,
                    custom_error_msg: str = None) -> Union[None, bool]:
 
-    if not arg_name:
-        arg_name = retrieve_arg_name(iterable)
+    # Lists and tuples are known to be iterable and support indexing.
+    is_sequence = isinstance(iterable, (list, tuple))
 
-    try:
-        iterator = iter(iterable)
+    if not is_sequence:
+        try:
+            iterator = iter(iterable)
 
-    except TypeError:
-        if is_try:
-            return False
+        except TypeError:
+            if is_try:
+                return False
 
-        if custom_error_msg is not None:
-            raise TypeError(custom_error_msg)
+            if custom_error_msg is not None:
+                raise TypeError(custom_error_msg)
 
-        raise TypeError(f"{arg_name} should be an iterable type but type {type(iterable)} does not support iteration.")
+            raise TypeError(f"{arg_name} should be an iterable type but type {type(iterable)} does not support iteration.")
 
     if not iterable_type:
         if is_try:
@@ -309,10 +324,18 @@ def check_iterable(iterable: Iterable,
 
         return
 
-    element = iterator.__next__()
-    is_correct_type = check_type(arg_name=arg_name, arg_types=iterable_type, arg_val=element, is_try=True)
+    # Only the first element is type checked. Empty iterables pass trivially.
+    first_elements = iterable[:1] if is_sequence else list(islice(iterator, 1))
+
+    if not first_elements:
+        if is_try:
+            return True
+
+        return
+
+    element = first_elements[0]
 
-    if not is_correct_type:
+    if not isinstance(element, iterable_type):
         if is_try:
             return False
 
@@ -325,12 +348,9 @@ def check_iterable(iterable: Iterable,
 
 
 def check_natural_number(arg_value: int,
-                         arg_name: str = None,
+                         arg_name: str = "Argument",
                          is_try: bool = False) -> Union[None, bool]:
 
-    if not arg_name:
-        arg_name = retrieve_arg_name(arg_value)
-
     if arg_value < 1:
         if is_try:
             return False
@@ -347,10 +367,25 @@ def _contains_nan(a, nan_policy='propagate'):
         raise ValueError("nan_policy must be one of {%s}" %
                          ', '.join("'%s'" % s for s in policies))
     try:
-        # Calling np.sum to avoid creating a huge array into memory
-        # e.g. np.isnan(a).any()
-        with np.errstate(invalid='ignore'):
-            contains_nan = np.isnan(np.sum(a))
+        a = np.asarray(a)
+
+        # Integer and boolean arrays can not hold nans.
+        if a.dtype.kind in 'biu':
+            contains_nan = False
+
+        elif a.size <= NAN_SCAN_CHUNK_SIZE:
+            contains_nan = bool(np.isnan(a).any())
+
+        else:
+            # Scan large arrays in fixed-size chunks to avoid creating a huge boolean array
+            # in memory while still returning on the first chunk containing a nan.
+            contains_nan = False
+            flat = a.ravel()
+
+            for start in range(0, flat.size, NAN_SCAN_CHUNK_SIZE):
+                if np.isnan(flat[start:start + NAN_SCAN_CHUNK_SIZE]).any():
+                    contains_nan = True
+                    break
     except TypeError:
         # If the check cannot be properly performed we fall back to omitting
         # nan values and raising a warning. This can happen when attempting to
@@ -369,14 +404,13 @@ def _contains_nan(a, nan_policy='propagate'):
 def strshort(instr,mlength):
     """Shorten a string using ellipsis
     """
+    def shorten(cstr):
+        return f"{cstr[:mlength-6]}...{cstr[-3:]}" if len(cstr) > mlength else cstr
+
     if isinstance(instr,list):
-        outstr = []
-        for i in range(len(instr)):
-            cstr = instr[i]
-            outstr.append((cstr[:mlength-6] + '...' + cstr[-3:]) if len(cstr) > mlength else cstr)
-    else:
-        outstr = (instr[:mlength-6] + '...' + instr[-3:]) if len(instr) > mlength else instr
-    return outstr
+        return [shorten(cstr) for cstr in instr]
+
+    return shorten(instr)
 
 
 def acf(x,mode='positive'):
@@ -385,14 +419,18 @@ def acf(x,mode='positive'):
     if x.ndim > 1:
         x = np.squeeze(x)
 
-    x = zscore(x)
-    acf = np.correlate(x,x,mode='full')
-    acf = acf / acf[acf.size//2]
+    # Autocorrelation via the power spectrum, zero-padded to avoid circular wrap-around.
+    # Scaling by the standard deviation cancels in the normalisation so only centring is needed.
+    n = x.size
+    n_fft = 1 << (2 * n - 1).bit_length()
+    x_fft = np.fft.rfft(x - x.mean(), n_fft)
+    acf = np.fft.irfft(np.abs(x_fft) ** 2, n_fft)[:n]
+    acf = acf / acf[0]
 
     if mode == 'positive':
-        return acf[acf.size//2:]
-    else:
         return acf
+    else:
+        return np.concatenate((acf[:0:-1], acf))
 
 
 def swap_chars(s, i_1, i_2):
@@ -402,19 +440,41 @@ def swap_chars(s, i_1, i_2):
         >>> print(swap_chars('heLlotHere', 2, 6))
         'heHlotLere'
     """
-    if i_1 > i_2:
-        i_1, i_2 = i_2, i_1
-    return ''.join([s[0:i_1], s[i_2], s[i_1+1:i_2], s[i_1], s[i_2+1:]])
+    chars = list(s)
+    chars[i_1], chars[i_2] = chars[i_2], chars[i_1]
+    return ''.join(chars)
 
 
-def normalise(a, axis=0, nan_policy='propogate'):
+def normalise(a, axis=0, nan_policy='propagate'):
 
-    contains_nan, nan_policy = _contains_nan(a, nan_policy)
+    a = np.asarray(a)
+    a_min = None
 
+    # np.min propagates nans, so for float arrays only the reduced minima need checking
+    # rather than making a separate pass over the full array.
+    if a.dtype.kind == 'f':
+        a_min = np.min(a, axis=axis)
+        contains_nan, nan_policy = _contains_nan(a_min, nan_policy)
+    else:
+        contains_nan, nan_policy = _contains_nan(a, nan_policy)
+
+    # Reduce each extremum once and reuse it for both the shift and the range.
     if contains_nan and nan_policy == 'omit':
-        return (a - np.nanmin(a,axis=axis)) / (np.nanmax(a,axis=axis) - np.nanmin(a,axis=axis))
+        a_min, a_max = np.nanmin(a, axis=axis), np.nanmax(a, axis=axis)
     else:
-        return (a - np.min(a,axis=axis)) / (np.max(a,axis=axis) - np.min(a,axis=axis))
+        if a_min is None:
+            a_min = np.min(a, axis=axis)
+
+        a_max = np.max(a, axis=axis)
+
+    a_range = a_max - a_min
+    a_norm = np.subtract(a, a_min)
+
+    # Divide in place when the shifted array can hold the result.
+    if np.issubdtype(a_norm.dtype, np.floating):
+        return np.divide(a_norm, a_range, out=a_norm)
+
+    return a_norm / a_range
 
 
 def standardise(a, dimension=0, df=1):
@@ -435,17 +495,26 @@ def standardise(a, dimension=0, df=1):
         numpy array
             standardised dataset
     """
-    # Avoid division by standard deviation if the process is constant.
-    a_sd = a.std(axis=dimension, ddof=df)
+    # Centre once and derive the standard deviation from the centred values,
+    # rather than letting np.std recompute the mean over the raw array.
+    n = a.shape[dimension]
+    a_centred = a - a.mean(axis=dimension, keepdims=True)
+    a_sd = np.sqrt((a_centred * a_centred).sum(axis=dimension, keepdims=True) / (n - df))
 
-    if np.isclose(a_sd, 0):
-        return a - a.mean(axis=dimension)
-    else:
-        return (a - a.mean(axis=dimension)) / a_sd
+    # Avoid division by standard deviation if the process is constant.
+    a_sd[np.isclose(a_sd, 0)] = 1
+    a_centred /= a_sd
+    return a_centred
 
 
 def convert_mdf_to_ddf(df):
-    ddf = pd.pivot_table(data=df.stack(dropna=False).reset_index(),index='Dataset',columns=['SPI-1', 'SPI-2'],dropna=False).T.droplevel(0)
+    stacked = df.stack(dropna=False)
+
+    # Average any entries sharing a (SPI-1, SPI-2, Dataset) key, as pivot_table did.
+    if not stacked.index.is_unique:
+        stacked = stacked.groupby(level=['SPI-1', 'SPI-2', 'Dataset'], dropna=False).mean()
+
+    ddf = stacked.unstack('Dataset').sort_index()
     return ddf
 
 
@@ -526,8 +595,7 @@ def filter_spis(keywords, output_name = None, configfile= None):
 
     # load in user-specified yaml
     try:
-        with open(configfile) as f:
-            yf = yaml.load(f, Loader=yaml.FullLoader)
+        yf, label_index = _load_label_index(configfile, _file_version(configfile))
     except FileNotFoundError:
         raise FileNotFoundError(f"Config file '{configfile}' not found.")
     except Exception as e:
@@ -537,12 +605,12 @@ def filter_spis(keywords, output_name = None, configfile= None):
     # new dictionary to be converted to final YAML
     filtered_subset = {}
     spis_found = 0
+    matched_spis = set.intersection(*(label_index.get(keyword, set()) for keyword in keywords))
     
     for module in yf:
         module_spis = {}
         for spi in yf[module]:
-            spi_labels = yf[module][spi].get('labels')
-            if all(keyword in spi_labels for keyword in keywords):
+            if (module, spi) in matched_spis:
                 module_spis[spi] = yf[module][spi]
                 if yf[module][spi].get('configs'):
                     spis_found += len(yf[module][spi].get('configs'))
@@ -565,7 +633,7 @@ def filter_spis(keywords, output_name = None, configfile= None):
     
     # write to YAML
     with open(output_file, "w") as outfile:
-        yaml.dump(filtered_subset, outfile, default_flow_style=False, sort_keys=False)
+        yaml.dump(filtered_subset, outfile, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
 
     # output relevant information
     print(f"""\nOperation Summary:
@@ -578,15 +646,78 @@ def filter_spis(keywords, output_name = None, configfile= None):
 """)
 
 
+def _file_version(path: str) -> tuple[int, int]:
+    """Return the (modification time in ns, size) pair identifying the current contents of a file."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, version: tuple[int, int]) -> dict:
+    """Load a YAML file, reusing the parsed result until the file is modified.
+
+    The file version from _file_version is only part of the cache key, so the returned
+    dictionary is shared between calls and must not be mutated.
+    """
+    # Hand the parser the whole file in one read rather than letting it pull small chunks through
+    # the file object. PyYAML detects the encoding of the raw bytes itself.
+    with open(path, "rb") as f:
+        data = f.read()
+
+    return yaml.load(data, Loader=YamlLoader)
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, version: tuple[int, int]) -> dict:
+    """Load a JSON file, reusing the parsed result until the file is modified.
+
+    As with _load_yaml_cached, the returned dictionary is shared between calls and must not be mutated.
+    """
+    # As for YAML, read the raw bytes in one call. Both orjson and json accept bytes directly.
+    with open(path, "rb") as f:
+        data = f.read()
+
+    return json_loads(data)
+
+
+@lru_cache(maxsize=8)
+def _load_label_index(path: str, version: tuple[int, int]) -> tuple[dict, dict[str, set[tuple[str, str]]]]:
+    """Load a YAML file along with an index from each label to the (module, SPI) pairs carrying it.
+
+    As with _load_yaml_cached, the returned objects are shared between calls and must not be mutated.
+    """
+    yf = _load_yaml_cached(path, version)
+    label_index = dict()
+
+    for module in yf:
+        for spi in yf[module]:
+            for label in yf[module][spi].get('labels') or list():
+                label_index.setdefault(label, set()).add((module, spi))
+
+    return yf, label_index
+
+
 def inspect_calc_results(calc):
     total_num_spis = calc.n_ss
     num_vars = calc.dataset.n_variables_subsample
     ss_results = dict({'Successful': list(), 'NaNs': list(), 'Partial NaNs': list()})
+
+    # Sweep the whole contiguous results table for nans once, then total the
+    # nan and entry counts per statistic from the first column level.
+    results = calc.results
+    vals = results.to_numpy()
+    nan_mask = np.isnan(vals) if vals.dtype.kind == 'f' else pd.isna(vals)
+    stat_level = results.columns.get_level_values(0)
+    nan_counts = pd.Series(np.count_nonzero(nan_mask, axis=0), index=stat_level).groupby(level=0).sum()
+    entry_counts = stat_level.value_counts() * vals.shape[0]
+
     for key in calc.ss.keys():
-        if calc.results[key].isna().all().all():
+        num_nans = nan_counts.get(key, 0)
+
+        if num_nans == entry_counts.get(key, 0):
             ss_results['NaNs'].append(key)
 
-        elif calc.results[key].isnull().values.sum() > num_vars:
+        elif num_nans > num_vars:
             # off-diagonal NaNs
             ss_results['Partial NaNs'].append(key)
 
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import logging
 import numpy as np
 import pandas as pd
-import warnings
 
 from tqdm import tqdm
 from typing import Union, Iterable, Any
 
 # From this package
+from pyss import settings
 from pyss.dataset import Dataset
 from pyss.config import Config
 from pyss.statistic import Statistic, ReducedStatistic
 
+logger = logging.getLogger(__name__)
+
 
 class Calculator:
     """
@@ -52,7 +55,7 @@ class Calculator:
         self._normalise: bool = normalise
         self._cached_configs = dict()
         self._dataset: Union[Dataset, None] = None
-        self._results_dict = dict()
+        self._reduced_results: list[tuple[str, str, np.ndarray]] = list()
         self._results = None
 
         self._loaded_modules = dict()
@@ -139,7 +142,8 @@ class Calculator:
             raise AttributeError(
                 "Dataset not loaded yet. Please provide dataset to the dataset property.")
 
-        results_dict = dict()
+        # Flat (statistic, reducer, result) records, in the order the results table lays them out.
+        reduced_results = list()
         stats = config.statistics
         reducers = config.reducers
         rstats = config.reduced_statistics
@@ -148,6 +152,7 @@ class Calculator:
 
         # Calculate configured Statistics.
         if stats:
+            stat_names = list()
             stat_pbar = tqdm(stats.keys())            
 
             for stat_name in stat_pbar:
@@ -160,18 +165,21 @@ class Calculator:
                     # Get result (checks cache first before computation).
                     stat.calculate(dataset)
 
-                    # Add the statistic reference to the results dictionary.
-                    results_dict[stat_name] = dict()
+                    # Record the statistic as available for reduction.
+                    stat_names.append(stat_name)
 
                 except Exception as e:
-                    warnings.warn(f'Caught {type(e)} for Statistic "{stat_name}": {e}')
+                    if settings.strict:
+                        raise
+
+                    logger.exception('Caught %s for Statistic "%s": %s', type(e).__name__, stat_name, e)
 
             stat_pbar.close()
             elapsed += stat_pbar.format_dict["elapsed"]
 
             # Calculate configured Reducers.        
             reducer_pbar = tqdm(reducers.keys())
-            stat_names = list(results_dict.keys())
+            stat_results = {stat_name: list() for stat_name in stat_names}
 
             for reducer_name in reducer_pbar:
                 reducer_pbar.set_description(f"Processing [{self._name}: {reducer_name}]")
@@ -191,21 +199,30 @@ class Calculator:
 
                         # If the Statistic is a ReducedStatistic (ie. an all-in-one) then store the result and continue.
                         if isinstance(stat, ReducedStatistic):
-                            results_dict[stat_name]["self"] = stat.get_result()
+                            if not stat_results[stat_name]:
+                                stat_results[stat_name].append((stat_name, "self", stat.get_result()))
                             continue
 
                         # Reduce the result.
                         R = reducer.calculate(stat).squeeze()
 
                         # Save results.
-                        results_dict[stat_name][reducer_name] = R
+                        stat_results[stat_name].append((stat_name, reducer_name, R))
 
                     except Exception as e:
-                        warnings.warn(f'Caught {type(e)} for Reducer "{stat_name}-{reducer_name}": {e}')
+                        if settings.strict:
+                            raise
+
+                        logger.exception('Caught %s for Reducer "%s-%s": %s',
+                                         type(e).__name__, stat_name, reducer_name, e)
 
             reducer_pbar.close()
             elapsed += reducer_pbar.format_dict["elapsed"]
 
+            # Group the reduced results by statistic.
+            for stat_name in stat_names:
+                reduced_results.extend(stat_results[stat_name])
+
         # Calculate configured ReducedStatistics.
         if rstats:
             
@@ -222,34 +239,39 @@ class Calculator:
                     R = rstat.calculate(dataset).squeeze()
 
                     # Save results.
-                    results_dict[rstat_name] = dict()
-                    results_dict[rstat_name]["self"] = R
+                    reduced_results.append((rstat_name, "self", R))
 
                 except Exception as e:
-                    warnings.warn(f'Caught {type(e)} for ReducedStatistic "{rstat_name}": {e}')
+                    if settings.strict:
+                        raise
+
+                    logger.exception('Caught %s for ReducedStatistic "%s": %s', type(e).__name__, rstat_name, e)
 
             rstat_pbar.close()
             elapsed += rstat_pbar.format_dict["elapsed"]
 
         print(f"\nCalculation complete. Time taken: {elapsed:.4f}s")
-        self._results = self._build_results_table(results_dict)
-        self._results_dict = results_dict
+        self._results = self._build_results_table(reduced_results)
+        self._reduced_results = reduced_results
         # inspect_calc_results(self)
 
     @staticmethod
-    def _build_results_table(results: dict) -> pd.DataFrame:
-        summaries_vec = np.ndarray((1, 0))
+    def _build_results_table(reduced_results: list[tuple[str, str, np.ndarray]]) -> pd.DataFrame:
+        # Size the summary vector up front and fill it in place rather than growing it per result.
+        total_size = sum(reduced_result.size for _, _, reduced_result in reduced_results)
+        dtype = np.result_type(np.float64, *[reduced_result.dtype for _, _, reduced_result in reduced_results])
+        summaries_vec = np.empty((1, total_size), dtype=dtype)
         first_level = []
         second_level = []
-
-        for stat_name, reducers in results.items():
-            for reducer_name, reduced_result in reducers.items():
-                size = reduced_result.size
-                summary_vec = reduced_result.reshape((1, size))
-                summaries_vec = np.hstack((summaries_vec, summary_vec))
-                first_level.extend([stat_name] * size)
-                second_level_names = [reducer_name] if size == 1 else [f"{reducer_name}_{i+1}" for i in range(size)]
-                second_level.extend(second_level_names)
+        offset = 0
+
+        for stat_name, reducer_name, reduced_result in reduced_results:
+            size = reduced_result.size
+            summaries_vec[0, offset:offset + size] = reduced_result.ravel()
+            offset += size
+            first_level.extend([stat_name] * size)
+            second_level_names = [reducer_name] if size == 1 else [f"{reducer_name}_{i+1}" for i in range(size)]
+            second_level.extend(second_level_names)
 
         columns = pd.MultiIndex.from_arrays(
             [first_level, second_level], names=["Statistic", "Reducer"]
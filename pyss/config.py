@@ -1,23 +1,151 @@
 from __future__ import annotations
 
+import copy
+import logging
 import yaml
 import warnings
 import os
 import re
 import inspect
 import importlib
+import importlib.util
+import sys
 import json
+import weakref
 import pyss.base as pyb
 
+from bisect import bisect_left
+from collections.abc import MutableMapping
 from typing import Union, Iterable, Generator, cast
 from types import ModuleType
-from runpy import run_path
 from argparse import Namespace
 
 from pyss.base import Component
 from pyss.statistic import Statistic, ReducedStatistic
 from pyss.reducer import Reducer
 
+logger = logging.getLogger(__name__)
+
+
+def _cached_import(module_reference: str, refresh: bool = False) -> ModuleType:
+
+    # Resolve relative references against this package, as importlib.import_module would.
+    module_reference = importlib.util.resolve_name(module_reference, __package__)
+    module = sys.modules.get(module_reference)
+
+    if module is None:
+        # Finders may have cached directory listings from before the module was installed.
+        if refresh:
+            importlib.invalidate_caches()
+
+        return importlib.import_module(module_reference)
+
+    if refresh:
+        # Reload in place so existing references to the module see the new definitions, and drop the
+        # component classes collected from the previous definitions.
+        importlib.invalidate_caches()
+        _MODULE_COMPONENT_CLASSES.pop(id(module), None)
+        module = importlib.reload(module)
+
+    return module
+
+
+# Package directory holding the modules of each component archetype, in the order from_archetypes loads them.
+_ARCHETYPE_PACKAGES = (("statistics", Statistic), ("reducers", Reducer), ("rstatistics", ReducedStatistic))
+
+# Instantiable Component classes found in each module, keyed by module id. The module is stored alongside
+# so a recycled id (ie: after a module file is reloaded) is not mistaken for a hit. Refreshed package modules
+# keep their id and have their entry dropped by _cached_import.
+_MODULE_COMPONENT_CLASSES: dict[int, tuple[Union[ModuleType, Namespace], list[type]]] = dict()
+
+
+# Components constructed from configuration schemes, reused while an instance is alive.
+_COMPONENT_INSTANCES = weakref.WeakValueDictionary()
+
+
+def _construct_component(component_class: type, scheme_name: str, scheme_args: dict) -> Component:
+
+    # Components are constructed once per class, scheme and arguments while an instance is alive. Components
+    # can opt out by declaring __pyss_no_cache__ = True.
+    if getattr(component_class, "__pyss_no_cache__", False):
+        return component_class(**scheme_args)
+
+    try:
+        instance_key = (component_class, scheme_name, json.dumps(scheme_args, sort_keys=True))
+    except TypeError:
+        return component_class(**scheme_args)
+
+    component = _COMPONENT_INSTANCES.get(instance_key)
+
+    if component is None:
+        # Instantiate the component class with configured arguments.
+        component = component_class(**scheme_args)
+        _COMPONENT_INSTANCES[instance_key] = component
+
+    return component
+
+
+class _LazyComponent:
+
+    """
+    A validated component scheme that is only instantiated when first looked up.
+    """
+
+    __slots__ = ("component_class", "scheme_name", "scheme_args")
+
+    def __init__(self, component_class: type, scheme_name: str, scheme_args: dict):
+        self.component_class = component_class
+        self.scheme_name = scheme_name
+        self.scheme_args = scheme_args
+
+    def __repr__(self) -> str:
+        return f"<lazy {self.component_class.__name__} scheme '{self.scheme_name}'>"
+
+    def materialize(self) -> Component:
+        component = _construct_component(self.component_class, self.scheme_name, self.scheme_args)
+        component.set_scheme(self.scheme_name)
+        return component
+
+
+class _LazyComponents(MutableMapping):
+
+    """
+    Maps full instance names to configured components, instantiating any lazily added components on first lookup.
+
+    Membership tests and iteration over names never instantiate components. Looking up values does.
+    """
+
+    def __init__(self):
+        self.__components = dict()
+
+    def __getitem__(self, name: str) -> Component:
+        component = self.__components[name]
+
+        if isinstance(component, _LazyComponent):
+            component = component.materialize()
+            self.__components[name] = component
+
+        return component
+
+    def __setitem__(self, name: str, component: Union[Component, _LazyComponent]):
+        self.__components[name] = component
+
+    def __delitem__(self, name: str):
+        del self.__components[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__components
+
+    def __iter__(self):
+        return iter(self.__components)
+
+    def __len__(self) -> int:
+        return len(self.__components)
+
+    def __repr__(self) -> str:
+        return repr(self.__components)
+
+
 class Config:
 
     """
@@ -37,10 +165,11 @@ class Config:
         multiple configurations.
     """
 
-    __TICK_CHAR = u'\u2714'
-    __CROSS_CHAR = u'\u2716'
-
     __cached_modules = dict()
+    __internal_modules = dict()
+    __statistic_filter_patterns = dict()
+    __component_module_names = dict()
+    __global_modules = None
     __cached_module_classes = dict()
     __available_dependencies = pyb.get_available_optional_deps()
 
@@ -49,13 +178,17 @@ class Config:
         self.__config_dict = dict()
         self.__reducer_filtered_stats = dict()
         self.__reducer_filters = dict()    
+        self.__sorted_stat_names = None
+
+        # The exported form of the configuration, kept up to date as components are added and removed.
+        self.__export_view = {"Statistics": dict(), "Reducers": dict(), "ReducedStatistics": dict()}
 
         component_types = ["Statistic", "Reducer", "ReducedStatistic"]
         self.__config_scheme = dict()
         self.__cached_module_classes = dict()
 
         for component_type in component_types:
-            self.__config_scheme[component_type] = dict()
+            self.__config_scheme[component_type] = _LazyComponents()
             self.__cached_module_classes[component_type] = dict()
 
     @property
@@ -115,8 +248,8 @@ class Config:
             yaml_string (string): A string in YAML format representing the configuration.
         """
         instance = cls(name)
-        print("Registering YAML string.")
-        instance.__config_dict = yaml.load(yaml_string, Loader=yaml.FullLoader)
+        logger.info("Registering YAML string.")
+        instance.__config_dict = yaml.load(yaml_string, Loader=pyb.YamlLoader)
         instance.__process_config_file()
         return instance
     
@@ -130,12 +263,12 @@ class Config:
             yaml_file_path (string): A file path pointing to a valid configuration in YAML format.
         """
         instance = cls(name)
-        print("Registering YAML configuration file: {}.".format(yaml_file_path))
+        logger.info("Registering YAML configuration file: %s.", yaml_file_path)
 
-        with open(yaml_file_path) as yaml_io:
-            config_dict = yaml.load(yaml_io, Loader=yaml.FullLoader)
+        # Parsed files are cached until modified, so take a copy the instance is free to own.
+        config_dict = pyb._load_yaml_cached(yaml_file_path, pyb._file_version(yaml_file_path))
+        instance.__config_dict = copy.deepcopy(config_dict)
 
-        instance.__config_dict = config_dict
         instance.__process_config_file()
         return instance
 
@@ -183,19 +316,17 @@ class Config:
                              " - reduced_statistic_archetypes must be provided.")
         
         instance = cls(name)
-        component_dirs = ["statistics", "reducers", "rstatistics"]
-        component_classes = [Statistic, Reducer, ReducedStatistic]
-        all_archetypes = [statistic_archetypes, reducer_archetypes, reduced_statistic_archetypes]
-        archetype_triples = zip(component_dirs, component_classes, all_archetypes)
-        
-        for dir, component_class, archetypes in archetype_triples:
-            for archetype in archetypes:
-                module_reference = f"pyss.{dir}.{archetype}"
-                module = cls.__get_module(module_reference)
-                instance.__cached_modules[module_reference] = module
+        all_archetypes = (statistic_archetypes, reducer_archetypes, reduced_statistic_archetypes)
+
+        for (package_dir, component_class), archetypes in zip(_ARCHETYPE_PACKAGES, all_archetypes):
+            prefix = f"pyss.{package_dir}."
+
+            # Each archetype module is loaded once, even if listed more than once.
+            for archetype in dict.fromkeys(archetypes):
+                module = cls.__get_module(prefix + archetype)
 
                 for module_obj in cls.__get_components_from_module(module):
-                    instance.__add_component(module_obj, component_class, "std")                
+                    instance.__add_component(module_obj, component_class, "std")
 
         if instance.statistics and instance.reducers:
             return instance
@@ -209,22 +340,35 @@ class Config:
     @staticmethod
     def __get_components_from_module(module: Union[ModuleType, Namespace]) -> Generator[Component]:
 
-        for name, module_obj in module.__dict__.items():
+        # Scan the module for instantiable classes once and reuse the result on later loads.
+        cached = _MODULE_COMPONENT_CLASSES.get(id(module))
 
-            if not inspect.isclass(module_obj):
-                continue
-            
-            if not issubclass(module_obj, Component):
-                continue
+        if cached is not None and cached[0] is module:
+            component_classes = cached[1]
+        else:
+            component_classes = list()
 
-            if hasattr(module_obj, "__abstractmethods__"):
-                abstract_methods = getattr(module_obj, "__abstractmethods__")
-                
-                if abstract_methods:
+            for name, module_obj in module.__dict__.items():
+
+                if not inspect.isclass(module_obj):
+                    continue
+
+                if not issubclass(module_obj, Component):
                     continue
 
-            if not pyb.has_required_func_args(module_obj.__init__):
-                yield module_obj()
+                if hasattr(module_obj, "__abstractmethods__"):
+                    abstract_methods = getattr(module_obj, "__abstractmethods__")
+
+                    if abstract_methods:
+                        continue
+
+                if not pyb.has_required_func_args(module_obj.__init__):
+                    component_classes.append(module_obj)
+
+            _MODULE_COMPONENT_CLASSES[id(module)] = (module, component_classes)
+
+        for component_class in component_classes:
+            yield component_class()
 
     @classmethod
     def from_dict(cls, name: str, config_dict: dict) -> Config:
@@ -236,7 +380,7 @@ class Config:
             config_dict (dictionary): A Python dictionary object representing a valid configuration.
         """
         instance = cls(name)
-        print("Registering configuration dictionary object.")
+        logger.info("Registering configuration dictionary object.")
         instance.__config_dict = config_dict
         instance.__process_config_file()
         return instance
@@ -251,9 +395,11 @@ class Config:
             json_file_path (string): A file path pointing to a valid configuration in JSON format.
         """
         instance = cls(name)
-        print("Registering YAML configuration file: {}.".format(json_file_path))
-        with open(json_file_path, "r") as f:
-            instance.__config_dict = json.load(f)
+        logger.info("Registering JSON configuration file: %s.", json_file_path)
+
+        # As for YAML files, parsed files are cached until modified and the instance takes its own copy.
+        config_dict = pyb._load_json_cached(json_file_path, pyb._file_version(json_file_path))
+        instance.__config_dict = copy.deepcopy(config_dict)
 
         instance.__process_config_file()
         return instance
@@ -464,33 +610,54 @@ class Config:
             self.__reducer_filtered_stats.pop(reducer, None)
 
     def __add_component(self,
-                        component: Component,
+                        component: Union[Component, _LazyComponent],
                         component_archetype: type,
                         scheme_name: str):
 
-        module = inspect.getmodule(component)
-        module_reference = self.__get_component_module_name(component)
-        component_type = type(component)
+        # Lazy components are registered by class and have their scheme set once instantiated.
+        if isinstance(component, _LazyComponent):
+            component_type = component.component_class
+            params = dict(pyb.get_init_arg_spec(component_type)[1])
+            params.update(component.scheme_args)
+        else:
+            component_type = type(component)
+            component.set_scheme(scheme_name)
+            params = component.params
+
+        component_archetype_name = component_archetype.__name__
+        scheme_bucket = self.__config_scheme[component_archetype_name]
+        class_bucket = self.__cached_module_classes[component_archetype_name]
+        export_bucket = self.__export_view[component_archetype_name + "s"]
+
+        module_reference = self.__get_component_type_module_name(component_type)
         component_type_name = component_type.__name__
 
         if module_reference not in self.__cached_modules:
-            self.__cached_modules[module_reference] = module
+            self.__cached_modules[module_reference] = inspect.getmodule(component_type)
 
-        component.set_scheme(scheme_name)
-        component_archetype_name = component_archetype.__name__
         full_component_name = self.__get_full_component_name(module_reference, component_type_name)
-        self.__cached_module_classes[component_archetype_name][full_component_name] = component_type
+        class_bucket[full_component_name] = component_type
 
-        full_instance_name = self.__get_full_instantiated_name(module_reference,
-                                                               component_type_name,
-                                                               scheme_name)
+        # The instance name extends the component name with the scheme.
+        full_instance_name = f"{full_component_name}.{scheme_name}"
 
-        if full_instance_name in self.__config_scheme[component_archetype_name]:
+        if full_instance_name in scheme_bucket:
             raise ValueError(f"{component_archetype_name} {full_instance_name} already exists.")
 
-        self.__config_scheme[component_archetype_name][full_instance_name] = component
-        print(f"    {self.__TICK_CHAR} {component_archetype_name} {component_type_name} scheme '{scheme_name}' "
-              f"added successfully.")
+        scheme_bucket[full_instance_name] = component
+
+        # Record the scheme in the export view.
+        module_dict = export_bucket.setdefault(module_reference, dict())
+        component_dict = module_dict.setdefault(component_type_name, {"schemes": dict()})
+        component_dict["schemes"][scheme_name] = pyb.to_python_value(params) if params else None
+
+        # Only Statistics invalidate the sorted names used by Reducer filters, so the snapshot built for the first
+        # Reducer of a scheme serves every Reducer after it.
+        if component_archetype is Statistic:
+            self.__sorted_stat_names = None
+
+        logger.debug("%s %s scheme '%s' added successfully.",
+                     component_archetype_name, component_type_name, scheme_name)
 
     def __remove_component(self,
                            component: Component,
@@ -512,6 +679,7 @@ class Config:
                                    scheme_name: str):
 
         component_archetype_name = component_archetype.__name__
+        export_bucket = self.__export_view[component_archetype_name + "s"]
         full_instance_name = self.__get_full_instantiated_name(module_reference,
                                                                component_type_name,
                                                                scheme_name)
@@ -521,11 +689,26 @@ class Config:
         if not result:
             warnings.warn(f"The {component_archetype_name} {component_type_name} was not found in the configuration.")
             return
-        
+
+        if component_archetype is Statistic:
+            self.__sorted_stat_names = None
+
+        # Prune the scheme from the export view, along with any component or module left empty.
+        module_dict = export_bucket[module_reference]
+        component_dict = module_dict[component_type_name]
+        schemes_dict = component_dict["schemes"]
+        del schemes_dict[scheme_name]
+
+        if not schemes_dict:
+            del module_dict[component_type_name]
+
+            if not module_dict:
+                del export_bucket[module_reference]
+
         component_type_name = type(result).__name__
         scheme_name = result.scheme
-        print(f"  {component_archetype_name} {component_type_name} scheme '{scheme_name}' "
-                f"removed successfully.")
+        logger.info("%s %s scheme '%s' removed successfully.",
+                    component_archetype_name, component_type_name, scheme_name)
         return result
 
     def to_yaml(self):
@@ -547,24 +730,9 @@ class Config:
             warnings.warn("No ReducedStatistics have been loaded. Skipping.")
             return        
 
-        yaml_dict = {
-            "Statistics": dict(),
-            "Reducers": dict(),
-            "ReducedStatistics": dict()
-        }
-
-        for stat in statistics:
-            self.__add_export_component(yaml_dict, stat, Statistic)
-
-        for reducer in reducers:
-            self.__add_export_component(yaml_dict, reducer, Reducer)
-            self.__add_export_reducer_statistic_filters(yaml_dict, reducer)
-
-        for reduced_statistic in reduced_statistics:
-            self.__add_export_component(yaml_dict, reduced_statistic, ReducedStatistic)
-
-        print(yaml_dict)
-        yaml_text = yaml.dump(yaml_dict, sort_keys=False)
+        # The export view is maintained as components are added and removed, so it only needs dumping.
+        logger.debug("Exporting configuration: %s", self.__export_view)
+        yaml_text = yaml.dump(self.__export_view, Dumper=pyb.YamlDumper, sort_keys=False)
         return yaml_text
 
     def export_yaml(self, export_path: str = None):
@@ -579,37 +747,8 @@ class Config:
         with open(export_path, "w") as f:
             f.write(yaml_text)
 
-    def __add_export_component(self, yaml_dict: dict, component: Component, component_archetype: type):
-        component_archetype_name = component_archetype.__name__ + "s"
-        module_name = self.__get_component_module_name(component)
-        scheme_name = component.scheme
-        params = component.params
-
-        if module_name not in yaml_dict[component_archetype_name]:
-            yaml_dict[component_archetype_name][module_name] = dict()
-
-        module_dict = yaml_dict[component_archetype_name][module_name]
-        component_name = type(component).__name__
-
-        if component_name not in module_dict:
-            module_dict[component_name] = dict()
-            module_dict[component_name]["schemes"] = dict()
-
-        schemes_dict = module_dict[component_name]["schemes"]
-        schemes_dict[scheme_name] = None if not params else params
-
-    def __add_export_reducer_statistic_filters(self, yaml_dict: dict, reducer: Reducer):
-        reducer_dict = yaml_dict["Reducers"]
-        module_name = self.__get_component_module_name(reducer)
-        module_dict = reducer_dict[module_name]
-        reducer_name = type(reducer).__name__
-        applicable_stats = self.get_reducer_filters(reducer)
-
-        if applicable_stats:
-            module_dict[reducer_name]["Statistics"] = list(applicable_stats)
-
     def __process_config_file(self):
-        print(f"Building internal configuration.")
+        logger.info("Building internal configuration.")
         stats_spec = self.__get_config_top_level("Statistics")
         reducers_spec = self.__get_config_top_level("Reducers")
         rstats_spec = self.__get_config_top_level("ReducedStatistics")        
@@ -626,6 +765,10 @@ class Config:
 
         self.__build_config_scheme(stats_spec, reducers_spec, rstats_spec)
 
+        # One summary record for the whole build. Per-component records are logged at DEBUG.
+        logger.info("Built configuration '%s': %d Statistics, %d Reducers, %d ReducedStatistics.",
+                    self.__name, len(self.statistics), len(self.reducers), len(self.reduced_statistics))
+
     def __get_config_top_level(self, level_name: str):
         level_dict = self.__config_dict.get(level_name)
 
@@ -643,15 +786,15 @@ class Config:
                               reducers_spec: dict,
                               rstats_spec: dict):
 
-        # Get instantiated Statistics based on configuration
-        stats_generator = self.__yield_instantiated_components(Statistic, stats_spec)
+        # Get Statistics based on configuration. These are only instantiated once looked up.
+        stats_generator = self.__yield_instantiated_components(Statistic, stats_spec, lazy=True)
 
         # Store each Statistic
         for stat, scheme_name, _ in stats_generator:
             self.__add_component(stat, Statistic, scheme_name)
 
-        # Get instantiated ReducedStatistics based on configuration
-        rstats_generator = self.__yield_instantiated_components(ReducedStatistic, rstats_spec)
+        # Get ReducedStatistics based on configuration. These are only instantiated once looked up.
+        rstats_generator = self.__yield_instantiated_components(ReducedStatistic, rstats_spec, lazy=True)
 
         # Store each ReducedStatistic
         for rstat, scheme_name, _ in rstats_generator:
@@ -668,7 +811,9 @@ class Config:
 
     def __yield_instantiated_components(self,
                                         component_archetype: type,
-                                        component_spec: dict) -> Generator[tuple[Component, str, dict]]:
+                                        component_spec: dict,
+                                        lazy: bool = False) -> Generator[tuple[Union[Component, _LazyComponent],
+                                                                               str, dict]]:
 
         component_archetype_name = component_archetype.__name__
 
@@ -730,7 +875,8 @@ class Config:
                                                              component_archetype_name,
                                                              component_class,
                                                              scheme_name,
-                                                             scheme_args)
+                                                             scheme_args,
+                                                             lazy)
 
                     # Return the component instance, scheme name and parameters.
                     yield component, scheme_name, component_params
@@ -741,27 +887,36 @@ class Config:
                                 component_archetype_name: str,
                                 component_class: type,
                                 scheme_name: str,
-                                scheme_args: dict) -> Component:
+                                scheme_args: dict,
+                                lazy: bool = False) -> Union[Component, _LazyComponent]:
 
-        # Get required constructor arguments
-        args = pyb.get_obj_init_args(component_class)
-        missing_args = list()
+        # Get required constructor arguments (cached per class).
+        required_args = pyb.get_required_init_args(component_class)
 
         # Check all required arguments are provided in the configuration
-        for arg, default in args.items():
-            if arg not in scheme_args and default is None:
-                missing_args.append(arg)
+        missing_args = required_args.difference(scheme_args)
 
         # If required arguments are missing, throw error.
         if missing_args:
             raise ValueError(f"{component_archetype_name} {component_name} configuration '{scheme_name}' "
                              + f"under module '{module_reference}' is missing the arguments:"
                              + f"\n\t"
-                             + "\n\t".join(missing_args))
+                             + "\n\t".join(sorted(missing_args)))
 
-        # Instantiate the component class with configured arguments.
-        component: Component = component_class(**scheme_args)
-        return component
+        # Defer construction when requested. Unknown arguments would otherwise only surface on first lookup.
+        if lazy:
+            if not pyb.has_init_var_kwargs(component_class):
+                unknown_args = set(scheme_args).difference(pyb.get_init_arg_spec(component_class)[1])
+
+                if unknown_args:
+                    raise TypeError(f"{component_archetype_name} {component_name} configuration '{scheme_name}' "
+                                    + f"under module '{module_reference}' has unexpected arguments:"
+                                    + f"\n\t"
+                                    + "\n\t".join(sorted(unknown_args)))
+
+            return _LazyComponent(component_class, scheme_name, scheme_args)
+
+        return _construct_component(component_class, scheme_name, scheme_args)
 
     def __add_reducer_statistic_filters(self,
                                         reducer: Reducer,
@@ -781,32 +936,70 @@ class Config:
                        custom_error_msg=f"Incorrect format for Reducer {reducer_name} 'Statistics' "
                                         f"definition under module {module_name}.")
 
-        available_stat_names = self.__config_scheme["Statistic"].keys()
+        # A snapshot shared by every Reducer until the Statistics change.
+        available_stat_names = self.__get_sorted_statistic_names()
 
         for stat_name in statistic_list:
-            esc_stat_name = "^" + re.escape(stat_name).replace("\\*", ".*")
-            viable_stat_names = [stat for stat in available_stat_names if re.match(esc_stat_name, stat)]
+            # Filters match from the start of the name, so a filter without wildcards, or with only trailing
+            # ones, is a plain prefix and needs no regular expression.
+            prefix = stat_name.rstrip("*")
 
-            for viable_stat_name in viable_stat_names:
-                filtered_stats.add(viable_stat_name)
+            if "*" not in prefix:
+                filtered_stats.update(self.__get_prefixed_statistic_names(available_stat_names, prefix))
+                continue
+
+            pattern = self.__get_statistic_filter_pattern(stat_name)
+            filtered_stats.update(stat for stat in available_stat_names if pattern.match(stat))
 
         self.__reducer_filtered_stats[reducer] = filtered_stats
         self.__reducer_filters[reducer] = statistic_filters
 
+        # Record the filters against the Reducer in the export view.
+        self.__export_view["Reducers"][module_name][reducer_name]["Statistics"] = list(statistic_list)
+
+    def __get_sorted_statistic_names(self) -> tuple[str, ...]:
+
+        # Statistic names are sorted lazily and kept until a component is added or removed.
+        if self.__sorted_stat_names is None:
+            self.__sorted_stat_names = tuple(sorted(self.__config_scheme["Statistic"]))
+
+        return self.__sorted_stat_names
+
+    @staticmethod
+    def __get_prefixed_statistic_names(stat_names: tuple[str, ...], prefix: str) -> Generator[str]:
+        for i in range(bisect_left(stat_names, prefix), len(stat_names)):
+            if not stat_names[i].startswith(prefix):
+                break
+
+            yield stat_names[i]
+
+    @classmethod
+    def __get_statistic_filter_pattern(cls, stat_name: str) -> re.Pattern:
+
+        # Wildcard filters are compiled once and shared between Reducers.
+        pattern = cls.__statistic_filter_patterns.get(stat_name)
+
+        if pattern is None:
+            pattern = re.compile(re.escape(stat_name).replace("\\*", ".*"))
+            cls.__statistic_filter_patterns[stat_name] = pattern
+
+        return pattern
+
     @classmethod
     def __get_module(cls,
                      module_reference: str,
                      global_modules: Union[dict, None] = None,
                      refresh_module: bool = False) -> Union[ModuleType, Namespace]:
 
-        # Check if module is cached.
-        module = cls.__get_cached_module(module_reference)
+        # Check if module is cached, unless a fresh copy is requested.
+        if not refresh_module:
+            module = cls.__get_cached_module(module_reference)
 
-        if module:
-            return module
+            if module:
+                return module
 
         # Check package modules.
-        module = cls.__get_package_module(module_reference)
+        module = cls.__get_package_module(module_reference, refresh_module)
 
         if module:
             return module
@@ -833,20 +1026,24 @@ class Config:
         module = cls.__cached_modules.get(module_reference)
 
         if module:
-            print(f"  {cls.__TICK_CHAR} Module {module_reference} already loaded.")
+            logger.info("Module %s already loaded.", module_reference)
             return module
         
     @classmethod
     def __get_package_module(cls,
-                             module_reference: str) -> ModuleType:
-        # Get package modules.
+                             module_reference: str,
+                             refresh_module: bool = False) -> ModuleType:
+        # Get package modules, skipping the import machinery for modules that are already imported.
         try:
-            module = importlib.import_module(module_reference, __package__)
-            print(f"  {cls.__TICK_CHAR} Module {module_reference} loaded successfully.")
+            module = _cached_import(module_reference, refresh=refresh_module)
+            logger.info("Module %s loaded successfully.", module_reference)
             
             if hasattr(module, "IMPORT_WARNINGS") and not pyb.IGNORE_IMPORT_WARNINGS:
-                print(f"    (The following warnings were raised: {[str(w.message) for w in module.IMPORT_WARNINGS]})")
+                logger.warning("Module %s raised the following warnings: %s",
+                               module_reference, [str(w.message) for w in module.IMPORT_WARNINGS])
 
+            # Later lookups of this reference are served from the class cache.
+            cls.__cached_modules[module_reference] = module
             return module
         except ModuleNotFoundError:
             pass
@@ -859,13 +1056,17 @@ class Config:
                             global_modules: Union[dict, None]) -> ModuleType:
     
         if not global_modules:
-            global_modules = {obj.__name__.lower(): obj for obj
-                              in globals().values() if inspect.ismodule(obj)}    
+            # The modules imported here do not change after import, so they are collected once.
+            if cls.__global_modules is None:
+                cls.__global_modules = {obj.__name__.lower(): obj for obj
+                                        in globals().values() if inspect.ismodule(obj)}
+
+            global_modules = cls.__global_modules
         
         module = global_modules.get(module_reference)
 
         if module:
-            print(f"  {cls.__TICK_CHAR} Module {module_reference} loaded from global environment.")
+            logger.info("Module %s loaded from global environment.", module_reference)
             return module
 
     @classmethod
@@ -885,7 +1086,9 @@ class Config:
             warnings.warn(f"No file could be found at the following path: {module_path}")
             return
 
-        # Load and return module
+        # Load and return module. runpy is only needed for module files, so it is imported here.
+        from runpy import run_path
+
         module_dict = run_path(module_path, run_name=module_path)
         module = Namespace(**module_dict)
         cls.__cached_modules[module_path] = module
@@ -912,11 +1115,11 @@ class Config:
                 return component_class
 
         # Otherwise check the module directory.
-        is_component_exists = component_name in module.__dir__()
+        is_component_exists = hasattr(module, component_name)
 
         # Skip if not present.
         if not is_component_exists:
-            print(f"  {cls.__CROSS_CHAR} {component_type_name} {component_name} could not be found. Skipping.")
+            logger.warning("%s %s could not be found. Skipping.", component_type_name, component_name)
             return
 
         # Get object from module
@@ -925,8 +1128,8 @@ class Config:
         # Check object is the expected type
         if not issubclass(component_class, component_archetype):
             type_name = component_class.__name__
-            print(f"  {cls.__CROSS_CHAR} {component_type_name} {component_name} is of type {type_name} which "
-                  f"is not a {component_type_name} object. Skipping.")
+            logger.warning("%s %s is of type %s which is not a %s object. Skipping.",
+                           component_type_name, component_name, type_name, component_type_name)
             return
 
         # Get the component dependencies
@@ -939,9 +1142,8 @@ class Config:
 
             if missing_dependencies:
                 dependency_delimited = ",".join(dependency_set)
-                print(f"  {cls.__CROSS_CHAR} {component_type_name} {component_name} is missing dependencies. "
-                      f"Skipping")
-                print(f"    (Missing dependencies: {dependency_delimited})")
+                logger.warning("%s %s is missing dependencies (%s). Skipping.",
+                               component_type_name, component_name, dependency_delimited)
                 return
 
         return component_class
@@ -958,31 +1160,58 @@ class Config:
 
     @classmethod
     def __get_component_module_name(cls, component: Component):
-        module = inspect.getmodule(component)
+        return cls.__get_component_type_module_name(type(component))
 
-        if module:
-            return cls.__get_module_name(module)
+    @classmethod
+    def __get_component_type_module_name(cls, component_type: type):
 
-        return component.__module__
+        # Module names are resolved once per component class.
+        module_name = cls.__component_module_names.get(component_type)
 
-    @staticmethod
-    def __is_internal_module(module_reference: str) -> bool:
+        if module_name is not None:
+            return module_name
 
-        try:
-            importlib.import_module(module_reference)
-            return True
-        except ModuleNotFoundError:
-            return False
-        except Exception as e:
-            raise e
+        module = inspect.getmodule(component_type)
+        module_name = cls.__get_module_name(module) if module else component_type.__module__
+        cls.__component_module_names[component_type] = module_name
+        return module_name
+
+    @classmethod
+    def __is_internal_module(cls, module_reference: str) -> bool:
+
+        # Check previously probed modules.
+        is_internal = cls.__internal_modules.get(module_reference)
+
+        if is_internal is not None:
+            return is_internal
+
+        # Already imported, pyss and standard library modules are importable by name without probing.
+        # The standard library list is only available from Python 3.10; earlier versions fall back to probing.
+        top_level_package = module_reference.partition(".")[0]
+
+        if (module_reference in sys.modules
+                or top_level_package == __package__
+                or top_level_package in getattr(sys, "stdlib_module_names", ())):
+            is_internal = True
+        else:
+            try:
+                _cached_import(module_reference)
+                is_internal = True
+            except ModuleNotFoundError:
+                is_internal = False
+            except Exception as e:
+                raise e
+
+        cls.__internal_modules[module_reference] = is_internal
+        return is_internal
 
     @staticmethod
     def __get_full_component_name(module_name: str, component_type_name: str) -> str:
-        return module_name + "." + component_type_name
+        return f"{module_name}.{component_type_name}"
 
     @staticmethod
     def __get_full_instantiated_name(module_name: str, component_type_name: str, scheme_name: str) -> str:
-        return ".".join([module_name, component_type_name, scheme_name])
+        return f"{module_name}.{component_type_name}.{scheme_name}"
 
     @staticmethod
     def __get_component_name_parts(full_component_name) -> tuple[str, str, str]:
@@ -991,4 +1220,6 @@ class Config:
 
     @staticmethod
     def __yaml_str_list_to_list(str_list: Union[str, list]):
-        return re.split(r"\s+", str_list) if isinstance(str_list, str) else str_list
+        # Whitespace separated lists need no regular expression. str.split also drops empty leading and
+        # trailing entries.
+        return str_list.split() if isinstance(str_list, str) else str_list
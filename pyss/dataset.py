@@ -4,14 +4,11 @@ Code is adapted from Patricia Wollstadt's IDTxL (https://github.com/pwollstadt/I
 """
 from __future__ import annotations
 
-import copy
-
 import numpy as np
 import pandas as pd
 import os
 
-from scipy.stats import zscore
-from scipy.signal import detrend
+from scipy.linalg import get_blas_funcs
 from typing import Iterable, Union
 from time import time
 
@@ -55,6 +52,9 @@ class Dataset:
             Truncates dataset to this many realisations, defaults to None.
         n_variables_subsample (int, optional):
             Truncates dataset to this many variables, defaults to None.
+        dtype (np.dtype, optional):
+            Floating point type to store the dataset in. Defaults to None, which keeps float32 (and promotes
+            float16) data in single precision and stores everything else as float64.
     """
 
     def __init__(
@@ -65,7 +65,8 @@ class Dataset:
             name: str = None,
             var_names: Iterable[str] = None,
             n_realisations_subsample: int = None,
-            n_variables_subsample: int = None):
+            n_variables_subsample: int = None,
+            dtype: np.dtype = None):
 
         self.normalise = normalise
         self.name = name
@@ -78,11 +79,13 @@ class Dataset:
         self.__data_type = None
         self.__data = None
         self.__var_names = list()
+        self.__intermediates = dict()
         self.__set_data(data=data,
                         dim_order=dim_order,
                         n_realisations_subsample=n_realisations_subsample,
                         n_variables_subsample=n_variables_subsample,
-                        var_names=var_names)
+                        var_names=var_names,
+                        dtype=dtype)
 
         self.instantiation_time = time()
 
@@ -97,7 +100,7 @@ class Dataset:
         if name is None:
             name = ""
 
-        base.check_type(name, str)
+        base.check_type(name, str, arg_name="name")
         self.__name = name
 
     @property
@@ -105,7 +108,7 @@ class Dataset:
         return self.__data
 
     @property
-    def data_type(self) -> type:
+    def data_type(self) -> np.dtype:
         return self.__data_type
 
     @property
@@ -114,7 +117,7 @@ class Dataset:
 
     @dim_order.setter
     def dim_order(self, dim_order: str):
-        base.check_type(dim_order, str)
+        base.check_type(dim_order, str, arg_name="dim_order")
 
         if len(dim_order) > 2:
             raise RuntimeError("dim_order can not have more than two entries")
@@ -127,7 +130,7 @@ class Dataset:
 
     @normalise.setter
     def normalise(self, normalise: bool):
-        base.check_type(normalise, bool)
+        base.check_type(normalise, bool, arg_name="normalise")
         self.__normalise = normalise
 
     @property
@@ -144,8 +147,8 @@ class Dataset:
     @n_realisations_subsample.setter
     def n_realisations_subsample(self, n_realisations_subsample: int):
         if n_realisations_subsample is not None:
-            base.check_type(n_realisations_subsample, int)
-            base.check_natural_number(n_realisations_subsample)
+            base.check_type(n_realisations_subsample, int, arg_name="n_realisations_subsample")
+            base.check_natural_number(n_realisations_subsample, arg_name="n_realisations_subsample")
 
         self.__n_subsample = n_realisations_subsample
 
@@ -163,8 +166,8 @@ class Dataset:
     @n_variables_subsample.setter
     def n_variables_subsample(self, n_variables_subsample: int):
         if n_variables_subsample is not None:
-            base.check_type(n_variables_subsample, int)
-            base.check_natural_number(n_variables_subsample)
+            base.check_type(n_variables_subsample, int, arg_name="n_variables_subsample")
+            base.check_natural_number(n_variables_subsample, arg_name="n_variables_subsample")
 
         self.__p_subsample = n_variables_subsample
 
@@ -177,6 +180,18 @@ class Dataset:
     def var_names_subsample(self) -> Iterable[str]:
         return self.__var_names[:self.__p_subsample]
 
+    def gram(self) -> np.ndarray:
+        """Scatter matrix of the centred data (p x p), shared by statistics and cached until the data changes."""
+        gram = self.__intermediates.get("gram")
+
+        if gram is None:
+            centred = self.data - self.data.mean(axis=0)
+            gram = centred.T @ centred
+            gram.flags.writeable = False
+            self.__intermediates["gram"] = gram
+
+        return gram
+
     def to_numpy(self,
                  realisation: int = None,
                  squeeze: bool = False) -> np.ndarray:
@@ -199,7 +214,8 @@ class Dataset:
         if isinstance(data, np.ndarray):
             return data
         elif isinstance(data, pd.DataFrame):
-            return data.to_numpy()
+            # Homogeneous frames hold a single block, which to_numpy returns as a view without copying.
+            return data.to_numpy(copy=False)
         elif isinstance(data, str):
             return Dataset.__load_data(data)
         else:
@@ -208,12 +224,20 @@ class Dataset:
     @staticmethod
     def __load_data(path: str) -> np.ndarray:
         ext = os.path.splitext(path)[1]
+        # Datasets with missing values are rejected, so np.loadtxt is used over the slower np.genfromtxt.
         if ext == ".npy":
             return np.load(path)
+        elif ext == ".npz":
+            with np.load(path) as npz:
+                return npz[npz.files[0]]
         elif ext == ".txt":
-            return np.genfromtxt(path)
+            return np.loadtxt(path)
         elif ext == ".csv":
-            return np.genfromtxt(path, ",")
+            return np.loadtxt(path, delimiter=",")
+        elif ext == ".parquet":
+            return Dataset.convert_to_numpy(pd.read_parquet(path))
+        elif ext == ".feather":
+            return Dataset.convert_to_numpy(pd.read_feather(path))
         elif ext == ".ts":
             from sktime.utils.data_io import load_from_tsfile_to_dataframe
             from sktime.datatypes._panel._convert import from_nested_to_3d_numpy
@@ -228,7 +252,8 @@ class Dataset:
                    dim_order: str = "np",
                    n_realisations_subsample: int = None,
                    n_variables_subsample: int = None,
-                   var_names: Iterable[str] = None):
+                   var_names: Iterable[str] = None,
+                   dtype: np.dtype = None):
 
         """Overwrite dataset in an existing instance.
 
@@ -250,35 +275,53 @@ class Dataset:
             var_names (Iterable[str], Optional):
                 Provides a set of names for the dataset variables. Must be the same length as the number
                 of variables (p).
+
+            dtype (np.dtype, Optional):
+                Floating point type to store the dataset in. With no value specified, single precision input
+                is kept as float32 and everything else is stored as float64.
         """
 
-        new_data = copy.deepcopy(data)
         self.dim_order = dim_order
         self.n_realisations_subsample = n_realisations_subsample
         self.n_variables_subsample = n_variables_subsample
 
+        # No up-front copy is taken. Arrays are only read from here on, and normalisation,
+        # variable addition and removal all allocate new arrays.
+        name = self.name
+
+        # Keep DataFrame column labels as variable names before the frame is converted.
+        if var_names is None and isinstance(data, pd.DataFrame) and dim_order[0] == "n":
+            var_names = [str(column) for column in data.columns]
+
+        new_data = self.convert_to_numpy(data)
+
         if len(dim_order) != new_data.ndim:
             raise RuntimeError(
                 "Data array dimension ({0}) and length of "
                 "dim_order ({1}) are not equal.".format(new_data.ndim, len(dim_order))
             )
 
-        if not self.name:
-            self.name = base.retrieve_arg_name(new_data, max_steps=3)
-
-        name = self.name
-        new_data = self.convert_to_numpy(new_data)
         new_data = self.__reorder_data(new_data, dim_order)
+
+        # Single precision halves the memory traffic of every statistic, so keep it when the input already
+        # has it. astype returns the input itself when no conversion is needed.
+        if dtype is None:
+            dtype = np.float32 if new_data.dtype in (np.float16, np.float32) else np.float64
+
+        new_data = new_data.astype(dtype, copy=False)
         #data = np.atleast_3d(data)
-        nans = np.isnan(new_data)
 
-        if nans.any():
+        # np.min propagates nans, so nan variables can be found from the per-variable minima
+        # without allocating a boolean mask the size of the data.
+        nan_vars = np.unique(np.nonzero(np.isnan(np.min(new_data, axis=0)))[0])
+
+        if nan_vars.size:
             raise ValueError(
-                f"Dataset {name} contains non-numerics (NaNs) in variables: {np.unique(np.where(nans)[0])}."
+                f"Dataset {name} contains non-numerics (NaNs) in variables: {nan_vars}."
             )
 
         self.__base_data = new_data
-        self.__data_type = type(new_data[0, 0])
+        self.__data_type = new_data.dtype
         self.__set_data_dim(new_data)
         new_data = self.__subsample_data(new_data)
 
@@ -288,42 +331,50 @@ class Dataset:
         self.__data = new_data
 
         if var_names is not None:
-            base.check_iterable(var_names)
+            base.check_iterable(var_names, arg_name="var_names")
             var_names_list = list(var_names)
-            base.check_type(var_names_list[0], str)
+            base.check_type(var_names_list[0], str, arg_name="var_names")
             self.__var_names = var_names
         else:
-            if isinstance(self.__base_data, pd.DataFrame):
-                self.__var_names = self.__base_data.columns
-            else:
-                self.__var_names = [f"var-{i}" for i in range(self.n_variables)]
+            self.__var_names = [f"var-{i}" for i in range(self.n_variables)]
 
         self.__message(
             f'Dataset "{name}" now has properties: {self.n_realisations} realisations, '
             f'{self.n_variables} variables.')
 
     def __subsample_data(self, data: np.ndarray) -> np.ndarray:
-        n_realisations = self.__n_subsample
-        n_variables = self.__p_subsample
-        subsampled_dataset = data
-
-        if n_realisations is not None:
-            subsampled_dataset = subsampled_dataset[:n_realisations]
-
-        if n_variables is not None:
-            subsampled_dataset = subsampled_dataset[:, :n_variables]
-
-        return subsampled_dataset
+        # Always a view of the base data; a None bound keeps the whole dimension. Normalisation
+        # copies only the subsampled block, so the discarded region is never touched.
+        return data[:self.__n_subsample, :self.__p_subsample]
 
     @staticmethod
     def __normalise_data(data: np.ndarray) -> np.ndarray:
         print("Normalising the dataset...\n")
-        data = zscore(data, axis=0, nan_policy="omit", ddof=1)
-        try:
-            data = detrend(data, axis=0)
-            return data
-        except ValueError as err:
-            print(f"Could not detrend dataset: {err}")
+
+        # Z-scoring followed by linear detrending, done on a single centred buffer. Against the centred
+        # realisation index t the trend of a centred variable is a pure slope, so detrending becomes a
+        # rank-1 update applied in place, and dividing the detrended data by the standard deviation of
+        # the centred data matches z-scoring first.
+        dtype = data.dtype if data.dtype.kind == "f" else np.float64
+        n = data.shape[0]
+
+        # Centre into a new column-major buffer, so each variable is contiguous in the result.
+        data = np.subtract(data, data.mean(axis=0, dtype=dtype), order="F", dtype=dtype)
+        data_sd = np.sqrt(np.einsum("ij,ij->j", data, data) / (n - 1))
+
+        # Avoid division by standard deviation if the process is constant.
+        data_sd[np.isclose(data_sd, 0)] = 1
+        data /= data_sd
+
+        t = np.arange(n, dtype=dtype)
+        t -= t.mean()
+        t_ss = t.dot(t)
+
+        if t_ss:
+            ger = get_blas_funcs("ger", (data,))
+            data = ger(-1 / t_ss, t, t @ data, a=data, overwrite_a=True)
+
+        return data
 
     @staticmethod
     def __message(message: str):
@@ -348,63 +399,76 @@ class Dataset:
 
         var_names = self.__var_names
         if var_name:
-            base.check_type(var_name, str)
+            base.check_type(var_name, str, arg_name="var_name")
             if var_name in var_names:
                 raise ValueError(f"Variable {var_name} already exists in the data.")
 
-        if var_index:
-            base.check_type(var_index, int)
+        if var_index is not None:
+            base.check_type(var_index, int, arg_name="var_index")
+
+            if var_index < 0:
+                var_index += self.n_variables
+
+            if not 0 <= var_index <= self.n_variables:
+                raise IndexError(f"var_index is out of bounds of data with {self.n_variables} variables.")
         else:
-            var_index = self.n_variables + 1
+            var_index = self.n_variables
 
-        base.check_type(var_data, np.ndarray)
+        base.check_type(var_data, np.ndarray, arg_name="var_data")
         var_data = np.squeeze(var_data)
 
         if var_data.ndim != 1:
             raise TypeError("Data must be a 1D numpy array.")
 
-        var_data_type = type(var_data[0, 0])
-        base.check_type(var_data_type, self.data_type)
-
-        var_data = np.expand_dims(var_data, axis=1)
+        if var_data.shape[0] != self.n_realisations:
+            raise ValueError(f"Data must have {self.n_realisations} realisations, received {var_data.shape[0]}.")
 
-        if self.normalise:
-            var_data = self.__normalise_data(var_data)
-
-        data = copy.deepcopy(self.__base_data)
+        if not np.can_cast(var_data.dtype, self.data_type, casting="same_kind"):
+            raise TypeError(f"var_data should be of a type castable to {self.data_type}, "
+                            f"received {var_data.dtype}.")
 
-        if var_index == self.n_variables + 1:
-            data = np.append(data, var_data, axis=1)
+        data = self.__insert_column(self.__base_data, var_index, var_data)
 
-            if not var_name:
-                var_name = f"var-{var_index}"
+        # Default names take the lowest free number, as removed variables can leave gaps in the numbering.
+        if not var_name:
+            used_names = set(var_names)
+            var_number = 0
 
-            self.__var_names.append(var_name)
-        else:
-            data = np.hstack((data[:, :var_index], var_data, data[:, var_index:]))
+            while f"var-{var_number}" in used_names:
+                var_number += 1
 
-            if not var_name:
-                var_name = f"var-{var_index}"
-                self.__var_names = [*var_names[:var_index],
-                                    var_name,
-                                    *[f"var-{j}" for j in range(var_index + 1, self.n_variables + 1)]]
+            var_name = f"var-{var_number}"
 
+        self.__var_names = [*var_names[:var_index], var_name, *var_names[var_index:]]
         self.__base_data = data
         self.__set_data_dim(data)
-        self.__data = self.__subsample_data(data)
+
+        # Normalisation acts on each variable independently, so only the new variable needs
+        # normalising before it is inserted into the existing normalised data.
+        p_subsample = self.__p_subsample
+
+        if p_subsample is None or var_index < p_subsample:
+            var_data = np.expand_dims(var_data[:self.__n_subsample], axis=1)
+
+            if self.normalise:
+                var_data = self.__normalise_data(var_data)
+
+            self.__data = self.__insert_column(self.__data, var_index, var_data[:, 0])[:, :p_subsample]
         self.__message(f"Variable {var_name} added at position {var_index} to data {self.name} successfully.")
         self.uncache()
 
     def remove_variable(self,
                         var_indices: Iterable[int]):
 
-        base.check_iterable(var_indices)
+        base.check_iterable(var_indices, arg_name="var_indices")
         var_indices_list = list(var_indices)
-        base.check_type(var_indices_list[0], int)
+        base.check_type(var_indices_list[0], int, arg_name="var_indices")
 
         try:
-            data = copy.deepcopy(self.__base_data)
-            data = np.delete(data, var_indices_list, axis=1)
+            # A boolean mask selects the kept columns in a single pass and allocates the result once.
+            keep = np.ones(self.n_variables, dtype=bool)
+            keep[var_indices_list] = False
+            data = self.__base_data[:, keep]
 
         except IndexError:
             print(
@@ -414,9 +478,36 @@ class Dataset:
 
         self.__base_data = data
         self.__set_data_dim(data)
-        self.__data = self.__subsample_data(data)
+        self.__var_names = [var_name for var_name, kept in zip(self.__var_names, keep) if kept]
+
+        # Without variable subsampling the remaining variables are already normalised, so their
+        # columns can be kept as they are. Otherwise, variables beyond the subsample move into it.
+        if self.__p_subsample is None:
+            self.__data = self.__data[:, keep]
+        else:
+            data = self.__subsample_data(data)
+
+            if self.normalise:
+                data = self.__normalise_data(data)
+
+            self.__data = data
+
         self.__message(f"Variables removed from the data {self.name} successfully.")
-        self.__set_data_dim(self.__data)
+        self.uncache()
+
+    @staticmethod
+    def __insert_column(data: np.ndarray,
+                        index: int,
+                        column: np.ndarray) -> np.ndarray:
+
+        """Return a copy of the data with a column inserted before the given index."""
+
+        # Filling a preallocated column-major buffer copies each column contiguously.
+        widened_data = np.empty((data.shape[0], data.shape[1] + 1), dtype=data.dtype, order="F")
+        widened_data[:, :index] = data[:, :index]
+        widened_data[:, index] = column
+        widened_data[:, index + 1:] = data[:, index:]
+        return widened_data
 
     @staticmethod
     def __reorder_data(data: np.ndarray,
@@ -438,6 +529,7 @@ class Dataset:
         self.__p = data.shape[1]
 
     def uncache(self, include_gc: bool = False):
+        self.__intermediates.clear()
         Statistic.uncache(self, include_gc)
 
     @staticmethod
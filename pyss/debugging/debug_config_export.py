@@ -1,4 +1,30 @@
+import os
+import tempfile
+
+import numpy as np
+
 from pyss.config import Config
+from pyss.reducers.basic import Moment
+from pyss.rstatistics.pca import PCAVarianceExplainedRatio
+from pyss.statistics.basic import Covariance
+
+
+if __name__ == "__main__":
+    testing_path = os.path.join("..", "run_config", "testing.yaml")
+    cfg = Config.from_yaml_file("tehe", testing_path)
+    cfg.export_yaml(os.path.join("..", "run_config", "woohoo.yaml"))
+
+    # Tuples and numpy scalars in scheme parameters must export as plain YAML and load back.
+    cfg = Config.from_yaml_file("tuples", testing_path)
+    cfg.add_statistic(Covariance(squared=np.bool_(True)), "np_squared")
+    cfg.add_reducer(Moment(moments=(2, 4)), "tuple_moments")
+    cfg.add_reducer(Moment(moments=[np.int64(2), np.int64(4)]), "np_moments")
+    cfg.add_reduced_statistic(PCAVarianceExplainedRatio(components=(np.int64(2), 4)), "np_components")
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        export_path = os.path.join(export_dir, "tuples.yaml")
+        cfg.export_yaml(export_path)
+        loaded_cfg = Config.from_yaml_file("tuples_loaded", export_path)
 
-cfg = Config.from_yaml_file("tehe", "..\\run_config\\testing.yaml")
-cfg.export_yaml("..\\run_config\\woohoo.yaml")
\ No newline at end of file
+    assert loaded_cfg.to_yaml() == cfg.to_yaml()
+    print(loaded_cfg.to_yaml())
@@ -58,4 +58,5 @@ Reducers:
           scaled: true
 """
 
-Config.from_yaml("test", yaml)
\ No newline at end of file
+if __name__ == "__main__":
+    Config.from_yaml("test", yaml)
@@ -1,4 +1,6 @@
 import numpy as np
 
-test = np.random.randint(0, high=10, size=(3, 3))
-print(test)
+
+if __name__ == "__main__":
+    test = np.random.randint(0, high=10, size=(3, 3))
+    print(test)
@@ -2,4 +2,6 @@ import numpy as np
 
 from pyss import Statistic
 
-mod = Statistic.available_statistics()
\ No newline at end of file
+
+if __name__ == "__main__":
+    mod = Statistic.available_statistics()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import numpy as np
-import copy
 import gc
 
 from abc import ABC, abstractmethod
@@ -31,11 +30,13 @@ class Reducer(Component, ABC):
             if result is not None:
                 return result
 
+        # Reducers share the Statistic result through a read-only view rather than a deep copy each.
         statistic_result = statistic.get_result()
-        statistic_result_cp = copy.deepcopy(statistic_result)
+        statistic_result_view = np.asarray(statistic_result).view()
+        statistic_result_view.flags.writeable = False
         #statistic_result_cp = np.atleast_3d(statistic_result_cp)
         #statistic_sliced = self._slice_data(statistic_result_cp)
-        result = self.compute(statistic_result_cp)
+        result = self.compute(statistic_result_view)
         result = np.array(result)
 
         if statistic_results is None:
@@ -16,12 +16,37 @@ class Norm(Reducer):
                                     Literal[2], Literal[-2],
                                     Literal["fro"], Literal["nuc"]]):
         self._order = order
+        self.__matrix_norm = _MATRIX_NORMS.get(order)
         super().__init__()
 
     def compute(self, data: np.ndarray) -> np.ndarray:
+        # Matrix norms with an O(n.p) closed form use the kernel bound for this order at initialisation.
+        if self.__matrix_norm is not None and data.ndim == 2:
+            return np.array(self.__matrix_norm(data))
+
         return np.array(np.linalg.norm(x=data, ord=self._order))
 
 
+def _frobenius_norm(data: np.ndarray) -> float:
+    entries = data.ravel(order="K")
+    return np.sqrt(entries.dot(entries))
+
+
+def _max_abs_column_sum(data: np.ndarray) -> float:
+    return np.abs(data).sum(axis=0).max()
+
+
+def _min_abs_column_sum(data: np.ndarray) -> float:
+    return np.abs(data).sum(axis=0).min()
+
+
+_MATRIX_NORMS = {
+    "fro": _frobenius_norm,
+    1: _max_abs_column_sum,
+    -1: _min_abs_column_sum
+}
+
+
 class EntryWiseMatrixNorm(Reducer):
 
     name = "Entry Wise Norm (L_p,q)"
@@ -34,10 +59,8 @@ class EntryWiseMatrixNorm(Reducer):
         super().__init__()
 
     def compute(self, data: np.ndarray) -> np.ndarray:
-        component_wise_power = abs(data)**self.__p
-        inner_sums = component_wise_power.sum(axis=1)**(self.__p / self.__q)
-        outer_sum = inner_sums.sum()**(1 / self.__q)
-        return outer_sum
+        inner_norms = np.linalg.norm(data, ord=self.__p, axis=1)
+        return np.linalg.norm(inner_norms, ord=self.__q)
 
 
 class SchattenNorm(Reducer):
@@ -51,6 +74,15 @@ class SchattenNorm(Reducer):
         super().__init__()
 
     def compute(self, data: np.ndarray) -> np.ndarray:
+        # The Schatten 2-norm is the Frobenius norm, which needs no decomposition.
+        if self.__p == 2:
+            return np.linalg.norm(data, ord="fro")
+
         svs = np.linalg.svd(data, compute_uv=False)
-        svs_power_sum = (svs**self.__p).sum()
+
+        # The Schatten 1-norm is the nuclear norm.
+        if self.__p == 1:
+            return svs.sum()
+
+        svs_power_sum = np.power(svs, self.__p, out=svs).sum()
         return svs_power_sum**(1 / self.__p)
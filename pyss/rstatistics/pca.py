@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+import weakref
 
 from sklearn.decomposition import PCA
 from abc import ABC
@@ -10,35 +11,42 @@ from pyss.dataset import Dataset
 
 class PCABase(ReducedStatistic, ABC):
 
-    __cached_pcas: dict[Dataset, tuple[PCA, int]] = dict()
+    # Fitted PCAs and the data shape they were fitted on, released along with their Dataset.
+    __cached_pcas: weakref.WeakKeyDictionary[Dataset, tuple[PCA, tuple[int, ...]]] = weakref.WeakKeyDictionary()
 
     def __init__(self, components: list[int]):
-        self.__cached_pca = None
+        self.__dataset = None
         self._components = components
         self.__n_components = max(self._components)
+        super().__init__()
     
     def calculate(self, dataset: Dataset):
-        cached_pca_tuple = self.__cached_pcas.get(dataset)
-        cached_pca = None
-        curr_n_components = 0
+        self.__dataset = dataset
 
+        try:
+            return super().calculate(dataset)
+        finally:
+            self.__dataset = None
+    
+    def _get_pca(self, data: np.ndarray) -> PCA:
+        dataset = self.__dataset
+        cached_pca_tuple = self.__cached_pcas.get(dataset) if dataset is not None else None
+
+        # Reuse a fit on the same data with at least as many components.
         if cached_pca_tuple:
-            cached_pca, curr_n_components = cached_pca_tuple
+            cached_pca, cached_shape = cached_pca_tuple
 
-        if curr_n_components >= self.__n_components:
-            self.__cached_pca = cached_pca
+            if cached_shape == data.shape and cached_pca.n_components_ >= self.__n_components:
+                return cached_pca
 
-        result = super().calculate(dataset)
-        self.__cached_pcas[dataset] = (self.__cached_pca, self.__n_components)
-        return result
-    
-    def _get_pca(self, data: np.ndarray) -> PCA:
-        if self.__cached_pca is not None:
-            return self.__cached_pca
-        
-        pca = PCA(n_components=self.__n_components)
+        # The "auto" solver already picks a randomised truncated SVD for large data with few
+        # components. Seeding it keeps those fits reproducible between runs.
+        pca = PCA(n_components=self.__n_components, random_state=0)
         pca.fit(data)
-        self.__cached_pca = pca
+
+        if dataset is not None:
+            self.__cached_pcas[dataset] = (pca, data.shape)
+
         return pca
 
 class PCAVarianceExplainedRatio(PCABase):
@@ -1,2 +1,8 @@
 max_cache_results = 10
 verbose = False
+
+# Number of joblib workers for the PairwiseStatistic loop (1 runs serially, -1 uses all cores).
+n_jobs = 1
+
+# Raise errors from Statistics and Reducers in Calculator.compute instead of logging and skipping them.
+strict = False
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-import runpy
-
 import numpy as np
-import copy
 import gc
+import weakref
 import importlib
+import inspect
 import pkgutil
 
 from abc import abstractmethod, ABC
-from typing import Union, TYPE_CHECKING
-from pathlib import Path
+from joblib import Parallel, delayed
+from typing import Callable, Union, TYPE_CHECKING
 
+from pyss import settings
 from pyss.base import Component
 from pyss.reducer import Reducer
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
 if TYPE_CHECKING:
     from pyss.dataset import Dataset
 
@@ -33,7 +38,12 @@ class Statistic(Component, ABC):
         - Input: (n x p) -> Output: (p x p)
     """
 
-    __cached_results: dict[Dataset, dict[Statistic, np.ndarray]] = dict()
+    # Results per Dataset, released along with their Dataset.
+    __cached_results: weakref.WeakKeyDictionary[Dataset, dict[Statistic, np.ndarray]] = weakref.WeakKeyDictionary()
+    __available_statistics: dict[type, set[type]] = dict()
+
+    # Default for subclasses that do not call Statistic.__init__.
+    __cached_result: Union[None, np.ndarray] = None
 
     def __init__(self):
         self.__cached_result = None
@@ -48,14 +58,16 @@ class Statistic(Component, ABC):
             result = dataset_results.get(self)
 
             if result is not None:
+                self.__set_result(result)
                 return result
 
         # Else compute from scratch.
         data = dataset.data
 
-        # Take a deep copy of the data.
-        data_copy = copy.deepcopy(data)
-        result = self.compute(data_copy)
+        # Statistics share the Dataset's data through a read-only view rather than a deep copy each.
+        data_view = np.asarray(data).view()
+        data_view.flags.writeable = False
+        result = self._compute_data(data_view)
 
         # Cache result in the hierarchy.
         if dataset_results is None:
@@ -66,9 +78,19 @@ class Statistic(Component, ABC):
             dataset_results[self] = result
 
         # Cache result locally.
-        self.__cached_result = result
+        self.__set_result(result)
         return result
 
+    def _compute_data(self, data: np.ndarray) -> np.ndarray:
+        # Compute the result from the Dataset's read-only data. Statistics accepting other data shapes override this.
+        return self.compute(data)
+
+    def __set_result(self, result: np.ndarray):
+        # Reducer results are cached per Statistic against its local result, so they are stale once it changes.
+        if result is not self.__cached_result:
+            Reducer.uncache(self)
+            self.__cached_result = result
+
     @classmethod
     def uncache(cls, dataset: Dataset, include_gc: bool = False):
         cached_dataset_results = cls.__cached_results.get(dataset)
@@ -86,30 +108,34 @@ class Statistic(Component, ABC):
         return self.__cached_result
 
     @classmethod
-    def available_statistics(cls):
-        glb_copy = globals()
-        stats = set()
+    def available_statistics(cls) -> set[type]:
+        """ Concrete subclasses of this class provided by the package's statistics modules.
+
+        Modules are imported once through importlib and the result is cached per class. Modules whose optional
+        dependencies are not installed are skipped.
+        """
+        stats = cls.__available_statistics.get(cls)
 
-        for obj in glb_copy.values():
-            obj_cls = type(obj)
+        if stats is not None:
+            return stats
 
-            if issubclass(obj_cls, cls):
-                stats.add(obj_cls)
+        stats = set()
 
-        this_path = Path(__file__)
-        dir_path = this_path.parent
-        paths = [str(dir_path / "statistics")]
+        for package_name in ("pyss.statistics", "pyss.rstatistics"):
+            package = importlib.import_module(package_name)
 
-        while paths:
-            path = paths.pop()
-            mods = list(pkgutil.iter_modules([path]))
+            for mod_info in pkgutil.walk_packages(package.__path__, f"{package_name}.", onerror=lambda name: None):
+                try:
+                    mod = importlib.import_module(mod_info.name)
+                except ImportError:
+                    continue
 
-            for mod in mods:
-                mod_path = path / (mod.name + ".py")
-                loaded_mod = runpy.run_path(str(mod_path))
+                for _, obj in inspect.getmembers(mod, inspect.isclass):
+                    if issubclass(obj, cls) and obj is not cls and not inspect.isabstract(obj):
+                        stats.add(obj)
 
-                for obj, val in loaded_mod.items():
-                    print(obj, val)
+        cls.__available_statistics[cls] = stats
+        return stats
 
     @staticmethod
     def _get_component_type() -> type:
@@ -126,26 +152,38 @@ class DynamicStatistic(Statistic, ABC):
         - Input: (n x p x t) -> Output: (p x p x t)
     """
 
-    def calculate(self, dataset: Dataset) -> np.ndarray:
+    def _compute_data(self, data: np.ndarray) -> np.ndarray:
 
         # If data is static n x p then just return a static statistic with m x m shape.
-        if dataset.data.ndim == 2:
-            return super().calculate(dataset)
+        if data.ndim == 2:
+            return self.compute(data)
 
-        # Else, compute the statistic for each time step.
-        data = dataset.data
-        results = []
+        # Else, compute the statistic for all time steps in one call if the statistic supports it.
+        S = self.compute_batched(data)
+
+        if S is not None:
+            return S
+
+        # Otherwise compute the statistic for each time step, writing each into a dynamic statistic with
+        # m x m x t shape allocated from the first result.
         t = data.shape[2]
+        result = np.asarray(self.compute(data[:, :, 0]))
+        S = np.empty(result.shape + (t,), dtype=result.dtype)
+        S[..., 0] = result
 
-        for s in range(t):
-            z = data[:, :, s]
-            result = super().calculate(z)
-            results.append(result)
+        for s in range(1, t):
+            S[..., s] = self.compute(data[:, :, s])
 
-        # And combine as a dynamic statistic with m x m x t shape.
-        S = np.stack(results, axis=2)
         return S
 
+    def compute_batched(self, data: np.ndarray) -> Union[None, np.ndarray]:
+        """ Optionally compute the statistic for every time step at once from the full (n x p x t) data.
+
+        Statistics with a batched kernel can override this to return the full (p x p x t) result,
+        avoiding a separate compute call per time step. Returning None falls back to compute.
+        """
+        return None
+
 
 class PairwiseStatistic(Statistic):
 
@@ -169,7 +207,9 @@ class PairwiseStatistic(Statistic):
 
         is_ordered (boolean): Declares whether the statistic requires ordered data (ie: the Wilcoxon signed-rank test).
             If False, computation is performed on the data as is.
-            If True, the data along the dim axis is ordered first before computation.
+            If True, the values of each compared entity (eg: each variable when dim="p") are sorted before
+            computation. Sorting x and y independently discards their pairing, so only statistics that compare
+            distributions rather than paired values should set this.
 
     Contracts:
         - Input: (n x p), dim: n -> Output: (n x n)
@@ -178,14 +218,22 @@ class PairwiseStatistic(Statistic):
         - Input: (n x p x t), dim: n -> Output: (n x n)
         - Input: (n x p x t), dim: p -> Output: (p x p)
         - Input: (n x p x t), dim: t -> Output: (t x t)
+
+    Subclasses whose statistic satisfies s(x, y) = s(y, x) should set _is_symmetric to True, halving the number of
+    pairwise_compute calls.
     """
 
+    _is_symmetric: bool = False
+
     def __init__(self,
                  dim: str,
                  is_ordered: bool):
 
         self.__dim = dim
         self.__is_ordered = is_ordered
+
+        # Axes swapped to bring the compared entity to the front, resolved once rather than on every compute.
+        self.__swap_axes = {"p": (0, 1), "t": (0, 2)}.get(dim)
         self.__check_temporal_compatibility(dim)
         super().__init__()
 
@@ -196,18 +244,10 @@ class PairwiseStatistic(Statistic):
                             "Dynamic methods compute a statistic for each time point.")
 
     def _reshape_data(self, data: np.ndarray) -> np.ndarray:
+        if self.__swap_axes is None:  # Consider adding an error if dim is not n, p, or t
+            return data
 
-        match self.__dim:
-            case "p":
-                data = data.swapaxes(0, 1)
-
-            case "t":
-                data = data.swapaxes(0, 2)
-
-            case _:  # Consider adding an error if dim is not n, p, or t
-                data = data
-
-        return data
+        return data.swapaxes(*self.__swap_axes)
 
     @abstractmethod
     def pairwise_compute(self,
@@ -215,28 +255,162 @@ class PairwiseStatistic(Statistic):
                          y: np.ndarray) -> Union[np.ndarray, float]:
         pass
 
+    def pairwise_compute_matrix(self, data: np.ndarray) -> Union[None, np.ndarray]:
+        """ Optionally compute all pairwise comparisons at once from the reshaped data (m x ...).
+
+        Statistics with a vectorised kernel can override this to return the full (m x m) matrix,
+        avoiding a Python call per pairing. Returning None falls back to pairwise_compute.
+        """
+        return None
+
     def compute(self, data: np.ndarray) -> np.ndarray:
         """ Compute statistics over all pairwise permutations.
         """
 
         data = self._reshape_data(data)
 
+        # Sort each compared entity's values in one pass, on a copy as the data is a read-only view shared
+        # with other statistics. Sorting along axis 0 would instead reorder values across the entities.
         if self.__is_ordered:
-            data.sort(axis=0)
+            data = np.sort(data, axis=1)
+
+        S = self.pairwise_compute_matrix(data)
+
+        if S is not None:
+            return S
 
         m = data.shape[0]
-        S = np.ndarray(shape=(m, m))
+        S = np.empty(shape=(m, m))
+        pairwise_compute = self.pairwise_compute
+
+        # Rows are independent, so with more than one worker each is computed as a separate joblib task.
+        if settings.n_jobs != 1:
+            is_symmetric = self._is_symmetric
+            row_values = Parallel(n_jobs=settings.n_jobs)(
+                delayed(_compute_pairwise_row)(pairwise_compute, data, i, i if is_symmetric else 0)
+                for i in range(m)
+            )
+
+            for i, values in enumerate(row_values):
+                if is_symmetric:
+                    S[i, i:] = S[i:, i] = values
+                else:
+                    S[i] = values
+
+            return S
+
+        rows = list(data)
 
-        for i in range(m):
-            x = data[i]
+        # Symmetric statistics only need the upper triangle, mirrored into the lower.
+        if self._is_symmetric:
+            for i, x in enumerate(rows):
+                for j in range(i, m):
+                    S[i, j] = S[j, i] = pairwise_compute(x, rows[j])
 
-            for j in range(m):
-                y = data[j]
-                S[i, j] = self.pairwise_compute(x, y)
+            return S
+
+        for i, x in enumerate(rows):
+            for j, y in enumerate(rows):
+                S[i, j] = pairwise_compute(x, y)
 
         return S
 
 
+class CorrelationStatistic(PairwiseStatistic, ABC):
+
+    """
+    Abstract PairwiseStatistic for correlation-like statistics, computed as the Pearson correlation of a transform
+    applied to each compared entity (ie: ranks for Spearman's correlation coefficient).
+
+    For static data all pairings come from a single transform and one correlation matrix. Time series comparisons
+    fall back to pairwise_compute, which subclasses implement.
+
+    Arguments:
+        squared (boolean): Declares whether the correlations are squared.
+        dim (string): Declares the data axis to perform pairwise comparisons over, as for PairwiseStatistic.
+    """
+
+    _is_symmetric = True
+
+    def __init__(self,
+                 squared: bool,
+                 dim: str = "p"):
+
+        self._is_squared = squared
+        super().__init__(dim=dim,
+                         is_ordered=False)
+
+    def row_transform(self, data: np.ndarray) -> np.ndarray:
+        """ Transform the reshaped (m x n) data, one row per compared entity. Identity by default.
+        """
+        return data
+
+    def pairwise_compute_matrix(self, data: np.ndarray) -> Union[None, np.ndarray]:
+        if data.ndim != 2:
+            return None
+
+        corr = np.corrcoef(self.row_transform(data))
+
+        if self._is_squared:
+            return corr ** 2
+
+        return corr
+
+
+def _compute_pairwise_row(pairwise_compute: Callable[[np.ndarray, np.ndarray], Union[np.ndarray, float]],
+                          data: np.ndarray,
+                          i: int,
+                          start: int) -> list[Union[np.ndarray, float]]:
+
+    x = data[i]
+    return [pairwise_compute(x, data[j]) for j in range(start, data.shape[0])]
+
+
+def numba_pairwise(cls: type[PairwiseStatistic]) -> type[PairwiseStatistic]:
+    """ Class decorator compiling a PairwiseStatistic's pairwise loop with Numba, when it is installed.
+
+    The decorated class must define pairwise_compute as a staticmethod taking two 1D arrays and returning a float,
+    written in the subset of Python and NumPy that Numba supports. The kernel and both loops over pairings are then
+    compiled together, with the outer loop run in parallel. Without Numba the class is returned unchanged and the
+    kernel runs through the usual Python loop.
+    """
+    # Look the kernel up without binding it, so inherited kernels are found and staticmethods can be told apart.
+    pairwise_compute = inspect.getattr_static(cls, "pairwise_compute", None)
+
+    if not isinstance(pairwise_compute, staticmethod):
+        raise TypeError(f"numba_pairwise requires {cls.__name__}.pairwise_compute to be a staticmethod taking two "
+                        f"1D arrays, as Numba cannot compile methods taking self. "
+                        f"Received {type(pairwise_compute).__name__}.")
+
+    if njit is None:
+        return cls
+
+    kernel = njit(pairwise_compute.__func__)
+
+    @njit(parallel=True)
+    def pairwise(data: np.ndarray, is_symmetric: bool) -> np.ndarray:
+        m = data.shape[0]
+        S = np.empty((m, m))
+
+        for i in prange(m):
+            for j in range(i if is_symmetric else 0, m):
+                S[i, j] = kernel(data[i], data[j])
+
+                if is_symmetric:
+                    S[j, i] = S[i, j]
+
+        return S
+
+    def pairwise_compute_matrix(self, data: np.ndarray) -> Union[None, np.ndarray]:
+        if data.ndim != 2:
+            return None
+
+        return pairwise(np.ascontiguousarray(data), self._is_symmetric)
+
+    cls.pairwise_compute_matrix = pairwise_compute_matrix
+    return cls
+
+
 class ReducedStatistic(Statistic, ABC):
 
     """
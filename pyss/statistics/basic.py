@@ -1,27 +1,41 @@
+from __future__ import annotations
+
 import inspect
 import numpy as np
 import scipy as sp
 
 from sklearn import covariance as skcov
-from typing import Union
+from typing import Union, TYPE_CHECKING
+
+from pyss.statistic import Statistic, DynamicStatistic, PairwiseStatistic, CorrelationStatistic
 
-from pyss.statistic import Statistic, PairwiseStatistic
+if TYPE_CHECKING:
+    from pyss.dataset import Dataset
 
+# Covariance estimators available from sklearn, resolved once at import.
+_COV_ESTIMATORS = {name: getattr(skcov, name) for name in dir(skcov) if inspect.isclass(getattr(skcov, name))}
 
-class Covariance(Statistic):
+
+class Covariance(DynamicStatistic):
     """
     Computes a variety of covariance statistics for static datasets (n x p) returning a p x p matrix.
     If a time series (n x p x t) is provided, dynamic covariance will be returned instead as a p x p x t tensor.
     Information on covariance estimators can be found at: https://scikit-learn.org/stable/modules/covariance.html
+
+    Passing dtype="float32" halves the memory moved by the covariance product for large datasets. The squared and
+    Precision variants amplify single precision rounding error, so keep float64 for those unless the data is
+    well conditioned.
     """
 
     __name = "Covariance"
     __identifier = "cov"
     __labels = ["basic", "unordered", "linear"]
+    _is_precision = False
 
     def __init__(self,
                  estimator: str = "EmpiricalCovariance",
-                 squared: bool = False):
+                 squared: bool = False,
+                 dtype: str = "float64"):
 
         if squared:
             self.__labels.append("unsigned")
@@ -29,8 +43,14 @@ class Covariance(Statistic):
         else:
             self.__labels.append("signed")
 
+        self.__dtype = np.dtype(dtype)
+
+        if self.__dtype != np.float64:
+            self.__identifier += f".{self.__dtype.name}"
+
         self.__is_squared = squared
         self.__estimator = estimator
+        self.__dataset = None
         super().__init__()
 
     @property
@@ -45,25 +65,70 @@ class Covariance(Statistic):
     def labels(self) -> list[str]:
         return self.__labels
 
+    def calculate(self, dataset: Dataset) -> np.ndarray:
+        # Keep the Dataset at hand so the empirical estimate can reuse its cached scatter matrix.
+        self.__dataset = dataset
+
+        try:
+            return super().calculate(dataset)
+        finally:
+            self.__dataset = None
+
     def compute(self, data: np.ndarray) -> np.ndarray:
-        cov_obj = self.__fit(data)
-        cov = cov_obj.covariance_
+        cov = self.__estimate(data)
 
         if self.__is_squared:
             cov = np.square(cov)
 
         return cov
 
+    def __estimate(self, data: np.ndarray) -> np.ndarray:
+        data = data.astype(self.__dtype, copy=False)
+
+        # The empirical (maximum likelihood) estimate is a single product of the centred data, so compute
+        # it directly rather than through sklearn's estimator construction and input validation.
+        if self.__estimator == "EmpiricalCovariance":
+            dataset = self.__dataset
+
+            # The scatter matrix is shared through the Dataset between Covariance, Precision and their variants.
+            if dataset is not None and data.ndim == 2 and dataset.data.dtype == self.__dtype:
+                cov = dataset.gram() / data.shape[0]
+            else:
+                centred = data - data.mean(axis=0)
+                cov = (centred.T @ centred) / data.shape[0]
+
+            return sp.linalg.pinvh(cov, check_finite=False) if self._is_precision else cov
+
+        cov_obj = self.__fit(data)
+        return cov_obj.precision_ if self._is_precision else cov_obj.covariance_
+
+    def compute_batched(self, data: np.ndarray) -> Union[None, np.ndarray]:
+        # Only the empirical estimate has a batched form. Other estimators are fitted per time step.
+        if self.__estimator != "EmpiricalCovariance":
+            return None
+
+        # A single batched product of the centred data over all time steps, as t x p x p.
+        data = data.astype(self.__dtype, copy=False)
+        centred = np.moveaxis(data - data.mean(axis=0), 2, 0)
+        cov = (centred.transpose(0, 2, 1) @ centred) / data.shape[0]
+
+        if self._is_precision:
+            cov = np.linalg.pinv(cov, hermitian=True)
+
+        if self.__is_squared:
+            cov = np.square(cov)
+
+        return np.moveaxis(cov, 0, 2)
+
     def __fit(self, data: np.ndarray):
-        cov_dir = [x for x in skcov.__dir__() if inspect.isclass(getattr(skcov, x))]
+        cov_class = _COV_ESTIMATORS.get(self.__estimator)
 
-        if self.__estimator not in cov_dir:
-            available_estimators = ", ".join(cov_dir)
+        if cov_class is None:
+            available_estimators = ", ".join(_COV_ESTIMATORS)
             raise AttributeError(f"The {self.__class__.__name__} estimator {self.__estimator} is not supported.\n"
                                  f"Options include: {available_estimators}.")
 
-        cov_class = getattr(skcov, self.__estimator)()
-        cov_obj = cov_class.fit(data)
+        cov_obj = cov_class().fit(data)
         return cov_obj
 
 
@@ -71,24 +136,58 @@ class Precision(Covariance):
 
     __name = "Precision"
     __identifier = "prec"
+    _is_precision = True
 
     def __init__(self,
                  estimator: str = "EmpiricalCovariance",
-                 squared: bool = False):
+                 squared: bool = False,
+                 dtype: str = "float64"):
 
         super().__init__(estimator=estimator,
-                         squared=squared)
+                         squared=squared,
+                         dtype=dtype)
 
-    def compute(self, dataset: np.ndarray) -> np.ndarray:
-        cov_obj = self.__fit(dataset)
-        cov = cov_obj.precision_
 
-        if self.__is_squared:
-            cov = np.square(cov)
+class PearsonR(CorrelationStatistic):
 
-        return cov
+    __name = "Pearson's correlation coefficient"
+    __identifier = "pearsonr"
+    __labels = ["basic", "unordered", "linear", "undirected"]
+
+    def __init__(self, squared: bool):
+        if squared:
+            self.__identifier += ".sq"
+            self.__labels = self.__labels + ["unsigned"]
+        else:
+            self.__labels = self.__labels + ["signed"]
+
+        super().__init__(squared=squared)
+
+    @property
+    def name(self) -> str:
+        return self.__name
 
-class SpearmanR(PairwiseStatistic):
+    @property
+    def identifier(self) -> str:
+        return self.__identifier
+
+    @property
+    def labels(self) -> list[str]:
+        return self.__labels
+
+    def pairwise_compute(self,
+                         x: np.ndarray,
+                         y: np.ndarray) -> Union[np.ndarray, float]:
+
+        corr = np.corrcoef(np.ravel(x), np.ravel(y))[0, 1]
+
+        if self._is_squared:
+            return corr ** 2
+
+        return corr
+
+
+class SpearmanR(CorrelationStatistic):
     # Setting the name internally.
     __name = "Spearman's correlation coefficient"
 
@@ -100,9 +199,6 @@ class SpearmanR(PairwiseStatistic):
 
     def __init__(self, squared: bool):
 
-        # Storing the squared argument.
-        self.__squared = squared
-
         # If squared,
         if squared:
 
@@ -118,8 +214,7 @@ class SpearmanR(PairwiseStatistic):
             self.__labels += ["signed"]
 
         # Call the base class initialiser with required arguments.
-        super().__init__(dim="p",
-                         is_ordered=False)
+        super().__init__(squared=squared)
 
     # Implementing the name property.
     @property
@@ -148,18 +243,24 @@ class SpearmanR(PairwiseStatistic):
         corr = sp.stats.spearmanr(x, y).correlation
 
         # Square results if required.
-        if self.__squared:
+        if self._is_squared:
             return corr ** 2
 
         # Return value.
         return corr
 
+    # Implementing the CorrelationStatistic's row_transform method.
+    # Spearman's coefficient is the Pearson correlation of ranks, so each variable is ranked once.
+    def row_transform(self, data: np.ndarray) -> np.ndarray:
+        return sp.stats.rankdata(data, axis=1)
+
 
 class KendallTau(PairwiseStatistic):
 
     __name = "Kendall's tau"
     __identifier = "kendalltau"
     __labels = ["basic", "unordered", "rank", "linear", "undirected"]
+    _is_symmetric = True
 
     def __init__(self, squared: bool, dim: str = "p"):
         self.__squared = squared
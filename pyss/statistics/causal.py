@@ -19,7 +19,7 @@ class AdditiveNoiseModel(PairwiseStatistic):
 
     def __init__(self):
         super().__init__(dim="p",
-                         is_ordered=True)
+                         is_ordered=False)
 
     # monkey-patch the anm_score function
     @staticmethod
@@ -46,6 +46,7 @@ class HilbertSchmidtIndependenceCriterion(PairwiseStatistic):
     __name = "Hilbert-Schmidt Independence Criterion"
     __identifier = "hsic"
     __labels = ["unsigned", "distance", "unordered", "nonlinear", "undirected"]
+    _is_symmetric = True
 
     def __init__(self, dim: str, biased: bool):
         self.__biased = biased
@@ -107,6 +108,7 @@ class DistanceCorrelation(PairwiseStatistic):
     __name = "Distance correlation"
     __identifier = "dcorr"
     __labels = ["unsigned", "distance", "unordered", "nonlinear", "undirected"]
+    _is_symmetric = True
 
     def __init__(self, dim: str, biased: bool):
         self.__biased = biased
@@ -168,6 +170,7 @@ class GromovWasserstainTau(PairwiseStatistic):
     name = "Gromov-Wasserstain Distance"
     identifier = "gwtau"
     labels = ["unsigned", "distance", "unordered", "nonlinear", "undirected"]
+    _is_symmetric = True
 
     def __init__(self):
         super().__init__(dim="p",
@@ -18,22 +18,24 @@ class LinearModel(PairwiseStatistic):
     def __init__(self, model):
         self.identifier += f".{model}"
         self._model = getattr(linear_model, model)
+
+        # Seed models that accept a random state, checking the signature once rather than per pair.
+        model_params = inspect.signature(self._model).parameters
+        self._model_kwargs = {"random_state": 42} if "random_state" in model_params else dict()
         super().__init__(dim="p", is_ordered=False)
 
     def pairwise_compute(self,
                          x: np.ndarray,
                          y: np.ndarray):
 
+        x_2d = x.reshape(-1, 1) if x.ndim == 1 else x
+        y_raveled = np.ravel(y)
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            y_raveled = np.ravel(y)
-            model_params = inspect.signature(self._model).parameters
-            if "random_state" in model_params:
-                mdl = self._model(random_state=42).fit(x, y_raveled)
-            else:
-                mdl = self._model().fit(x, y_raveled)
-
-        y_predict = mdl.predict(x)
+            mdl = self._model(**self._model_kwargs).fit(x_2d, y_raveled)
+
+        y_predict = mdl.predict(x_2d)
         return mean_squared_error(y_predict, y_raveled)
 
 
@@ -42,10 +44,19 @@ class GPModel(PairwiseStatistic):
     identifier = "gpfit"
     labels = ["misc", "unsigned", "unordered", "normal", "nonlinear", "directed"]
 
-    def __init__(self, kernel="RBF"):
+    def __init__(self, kernel="RBF", n_components: int = None):
         self.identifier += f"_{kernel}"
         self._kernel = kernels.ConstantKernel() + kernels.WhiteKernel()
         self._kernel += getattr(kernels, kernel)()
+
+        # Optional low-rank approximation with the kernel's default hyperparameters (see pairwise_compute_matrix).
+        self._n_components = n_components
+        self._signal_kernel = kernels.ConstantKernel() + getattr(kernels, kernel)()
+        self._noise_level = kernels.WhiteKernel().noise_level
+
+        if n_components is not None:
+            self.identifier += f".nys{n_components}"
+
         super().__init__(dim="p", is_ordered=False)
 
     def pairwise_compute(self,
@@ -61,6 +72,32 @@ class GPModel(PairwiseStatistic):
         y_predict = gp.predict(x_2d)
         return mean_squared_error(y_predict, y_raveled)
 
+    def pairwise_compute_matrix(self, data: np.ndarray):
+
+        # Exact per-pair fits unless a low-rank approximation was requested.
+        if self._n_components is None or data.ndim != 2:
+            return None
+
+        # With fixed hyperparameters, the GP posterior mean at the training inputs is a ridge regression on
+        # Nystroem features of x, so one factorisation per x serves every target variable at once.
+        m, n = data.shape
+        landmarks = np.linspace(0, n - 1, min(n, self._n_components)).astype(int)
+        targets = data.T
+        S = np.empty(shape=(m, m))
+
+        for i, x in enumerate(data):
+            x_2d = x.reshape(-1, 1)
+            evals, evecs = np.linalg.eigh(self._signal_kernel(x_2d[landmarks]))
+            keep = evals > 1e-10 * evals.max()
+            features = self._signal_kernel(x_2d, x_2d[landmarks]) @ (evecs[:, keep] / np.sqrt(evals[keep]))
+
+            gram = features.T @ features
+            gram[np.diag_indices_from(gram)] += self._noise_level
+            y_predict = features @ np.linalg.solve(gram, features.T @ targets)
+            S[i] = np.mean((y_predict - targets) ** 2, axis=0)
+
+        return S
+
 
 class PowerEnvelopeCorrelation(Statistic):
     # Setting the name internally.
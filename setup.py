@@ -36,6 +36,10 @@ testing_extras = [
     'pytest==5.4.2',  # unittest.TestCase funkyness, see commit 77c1505ab
 ]
 
+speedup_extras = [
+    'orjson',  # faster JSON configuration parsing, falls back to json
+]
+
 
 setup(
     name='pyss',
@@ -81,5 +85,5 @@ setup(
         "Topic :: Scientific/Engineering :: Medical Science Apps.",
     ],
     install_requires=install_requires,
-    extras_require={'testing': testing_extras}
+    extras_require={'testing': testing_extras, 'speedups': speedup_extras}
 )